@@ -0,0 +1,248 @@
+"""
+Benchmark suite for the string matching algorithms and the end-to-end search.
+
+Algorithms are measured on the text of the real CVs in data/ (through the text cache), across
+keyword counts, pattern lengths and corpus sizes. Keywords are sampled with a fixed seed, so two
+runs on the same corpus measure the same work. Results are written as JSON and can be compared
+against a stored baseline: a case that got slower than the tolerance allows is a regression.
+
+    uv run src/benchmark.py --output bench.json
+    uv run src/benchmark.py --save-baseline bench_baseline.json
+    uv run src/benchmark.py --baseline bench_baseline.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+
+from models.search import SearchAlgorithm, SearchParams, SearchResult
+from cli import ALGORITHMS
+from engine.executor import SIMILARITY_THRESHOLD, compile_matchers, compile_scanner, count_keywords
+from lib.encoding import encode_text
+from lib.levenshtein import NUMPY_AVAILABLE, count_similar
+from util.text_cache import TextCache
+
+DEFAULT_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+BENCHMARK_VERSION = 1
+
+KEYWORD_COUNTS = (1, 10, 100, 1000)
+PATTERN_LENGTHS = (3, 6, 12, 24)
+CORPUS_SIZES = (10, 100, 1000)
+BASE_KEYWORD_COUNT = 10   # Keyword count of the pattern length and corpus size sweeps
+BASE_CORPUS_SIZE = 50     # CVs scanned by the keyword count and pattern length sweeps
+
+""" Corpus and workload """
+def load_corpus(data_dir: str, limit: int | None = None) -> list[str]:
+    """Texts of the PDFs below data_dir in a stable order, parsed once and then read from the text cache"""
+    paths = []
+    for directory, subdirectories, filenames in os.walk(data_dir):
+        subdirectories.sort()
+        paths.extend(os.path.join(directory, file) for file in sorted(filenames) if file.endswith(".pdf"))
+    if limit:
+        paths = paths[:limit]
+    text_cache = TextCache()
+    return [text_cache.get_text(path) for path in paths]
+
+def sample_words(corpus: list[str], count: int, rng: random.Random) -> list[str]:
+    """Distinct words of the corpus, the keywords a recruiter would type"""
+    vocabulary = sorted({word for text in corpus for word in re.findall(r'[a-z]{3,}', text)})
+    if count >= len(vocabulary):
+        return vocabulary
+    return rng.sample(vocabulary, count)
+
+def sample_substrings(corpus: list[str], count: int, length: int, rng: random.Random) -> list[str]:
+    """Substrings of the given length taken from random positions, so every pattern occurs at least once"""
+    texts = [text for text in corpus if len(text) >= length]
+    patterns = []
+    for _ in range(count):
+        if not texts:
+            break
+        text = rng.choice(texts)
+        start = rng.randrange(len(text) - length + 1)
+        patterns.append(text[start:start + length])
+    return patterns
+
+""" Measured operations """
+def run_exact(algorithm: SearchAlgorithm, corpus: list[bytes], keywords: list[str]) -> int:
+    # Building the automaton and shift tables is part of the cost of a search
+    compile_scanner.cache_clear()
+    compile_matchers.cache_clear()
+    total = 0
+    for text in corpus:
+        total += sum(count_keywords(algorithm, text, keywords).values())
+    return total
+
+def run_levenshtein(corpus: list[str], keywords: list[str]) -> int:
+    """The per-CV work of the fuzzy search: every keyword against every distinct word"""
+    total = 0
+    for text in corpus:
+        words = list(set(re.findall(r'[a-z]+', text)))
+        for keyword in keywords:
+            total += count_similar(keyword, words, SIMILARITY_THRESHOLD)
+    return total
+
+def measure(function: Callable[[], object], repeat: int) -> dict:
+    function()  # Warm up caches, e.g. the text cache and compiled regexes
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - start)
+    return {"seconds": statistics.median(runs), "min": min(runs), "runs": runs}
+
+""" Suites """
+def algorithm_cases(corpus: list[str], seed: int, keyword_counts, pattern_lengths, corpus_sizes):
+    """Yields (case name, function) for every algorithm over the three sweeps"""
+    # The matchers scan the encoded form, like scan_exact does with the text cache
+    encoded_corpus = [encode_text(text) for text in corpus]
+    base_encoded = encoded_corpus[:BASE_CORPUS_SIZE]
+    base_corpus = corpus[:BASE_CORPUS_SIZE]
+
+    for count in keyword_counts:
+        keywords = sample_words(corpus, count, random.Random(seed))
+        for name, algorithm in ALGORITHMS.items():
+            yield f"match/{name}/keywords={count}", lambda a=algorithm, k=keywords: run_exact(a, base_encoded, k)
+        yield f"match/Levenshtein/keywords={count}", lambda k=keywords: run_levenshtein(base_corpus, k)
+
+    for length in pattern_lengths:
+        keywords = sample_substrings(corpus, BASE_KEYWORD_COUNT, length, random.Random(seed))
+        for name, algorithm in ALGORITHMS.items():
+            yield f"match/{name}/length={length}", lambda a=algorithm, k=keywords: run_exact(a, base_encoded, k)
+
+    keywords = sample_words(corpus, BASE_KEYWORD_COUNT, random.Random(seed))
+    for size in corpus_sizes:
+        if size > len(corpus):
+            continue
+        sized_corpus = corpus[:size]
+        sized_encoded = encoded_corpus[:size]
+        for name, algorithm in ALGORITHMS.items():
+            yield f"match/{name}/cvs={size}", lambda a=algorithm, c=sized_encoded: run_exact(a, c, keywords)
+        yield f"match/Levenshtein/cvs={size}", lambda c=sized_corpus: run_levenshtein(c, keywords)
+
+def search_cases(backend: str, workers: int | None, corpus: list[str], seed: int):
+    """Yields (case name, function) for exact_search and fuzzy_search on the seeded database"""
+    from database.backends import open_database
+    from engine.search_engine import SearchEngine
+
+    db = open_database(backend)
+    if db.connection is None:
+        print("Database is not available, skipping the end-to-end search benchmarks.")
+        return
+    engine = SearchEngine(db, workers)
+    try:
+        applications = db.get_all_application_details()
+        keywords = sample_words(corpus, BASE_KEYWORD_COUNT, random.Random(seed))
+        # Words that appear nowhere, so the fuzzy search has to look at every CV
+        misspelled = [word[:-1] + "q" for word in keywords if len(word) > 4][:3] or ["pythonq"]
+        for name, algorithm in ALGORITHMS.items():
+            params = SearchParams(keywords, algorithm, 0)
+            yield f"search/exact/{name}", lambda p=params: engine.exact_search(p, SearchResult([], 0, 0), applications)
+        params = SearchParams(misspelled, SearchAlgorithm.KMP, 0)
+        yield "search/fuzzy", lambda: engine.fuzzy_search(params, SearchResult([], 0, 0), applications, {})
+    finally:
+        engine.close()
+        db.close()
+
+""" Baseline comparison """
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Prints current vs baseline for every shared case, returns the names of the regressions"""
+    baseline_cases = {case["name"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>11} {'current':>11} {'ratio':>7}")
+    for case in results["cases"]:
+        previous = baseline_cases.get(case["name"])
+        if previous is None:
+            continue
+        ratio = case["seconds"] / previous["seconds"] if previous["seconds"] > 0 else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(case["name"])
+        elif ratio < 1 - tolerance:
+            flag = "  faster"
+        print(f"{case['name']:<40} {previous['seconds'] * 1000:9.2f}ms {case['seconds'] * 1000:9.2f}ms {ratio:7.2f}{flag}")
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the string matching algorithms and the CV search.")
+    parser.add_argument("--data", default=DEFAULT_DATA_DIR, metavar="DIR", help="Directory of CV PDFs (default: data).")
+    parser.add_argument("--limit", type=int, default=None, metavar="N", help="Only load the first N CVs.")
+    parser.add_argument("--repeat", type=int, default=5, metavar="N", help="Timed runs per case, the median is reported (default: 5).")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the keyword sampling (default: 42).")
+    parser.add_argument("--keyword-counts", type=int, nargs="+", default=KEYWORD_COUNTS, metavar="N")
+    parser.add_argument("--pattern-lengths", type=int, nargs="+", default=PATTERN_LENGTHS, metavar="N")
+    parser.add_argument("--corpus-sizes", type=int, nargs="+", default=CORPUS_SIZES, metavar="N")
+    parser.add_argument("--filter", default="", metavar="TEXT", help="Only run cases whose name contains TEXT.")
+    parser.add_argument("--search", action="store_true", help="Also time exact_search/fuzzy_search end to end (needs a seeded database).")
+    parser.add_argument("--db", choices=("mysql", "sqlite"), default="mysql", help="Backend for --search (default: mysql).")
+    parser.add_argument("--workers", type=int, default=None, metavar="N", help="Worker processes for --search.")
+    parser.add_argument("--output", metavar="FILE", help="Write the results as JSON to FILE.")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the results as the new baseline FILE.")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a baseline FILE, exits with 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown against the baseline (default: 0.2 = 20%%).")
+    args = parser.parse_args()
+
+    print(f"Loading corpus from {args.data}...")
+    corpus = load_corpus(args.data, args.limit)
+    if not corpus:
+        print("No CVs found.")
+        return 2
+    print(f"{len(corpus)} CVs, {sum(map(len, corpus))} characters")
+
+    # Consumed lazily: the search cases keep their database and engine open until the last one ran
+    cases = algorithm_cases(corpus, args.seed, args.keyword_counts, args.pattern_lengths, args.corpus_sizes)
+    if args.search:
+        cases = itertools.chain(cases, search_cases(args.db, args.workers, corpus, args.seed))
+
+    results = {
+        "version": BENCHMARK_VERSION,
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus_cvs": len(corpus),
+            "corpus_chars": sum(map(len, corpus)),
+            "seed": args.seed,
+            "numpy": NUMPY_AVAILABLE,
+            "repeat": args.repeat,
+        },
+        "cases": [],
+    }
+    for name, function in cases:
+        if args.filter not in name:
+            continue
+        timing = measure(function, args.repeat)
+        results["cases"].append({"name": name, **timing})
+        print(f"{name:<40} {timing['seconds'] * 1000:9.2f}ms (min {timing['min'] * 1000:.2f}ms)")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("corpus_cvs") != len(corpus):
+            print("Warning: the baseline was measured on a different corpus.")
+        if baseline.get("meta", {}).get("numpy", NUMPY_AVAILABLE) != NUMPY_AVAILABLE:
+            print("Warning: the baseline was measured with numpy " + ("not " if NUMPY_AVAILABLE else "") + "installed, the Levenshtein cases are not comparable.")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
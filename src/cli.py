@@ -0,0 +1,103 @@
+import json
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import TextIO
+from models.search import SearchAlgorithm, SearchParams, SearchResult
+
+""" Headless search, runs the same SearchEngine as the GUI without importing PyQt6 """
+
+ALGORITHMS = {
+    "KMP": SearchAlgorithm.KMP,
+    "BM": SearchAlgorithm.BM,
+    "AC": SearchAlgorithm.AHO_CORASICK,
+    "BM-GS": SearchAlgorithm.BM_GOOD_SUFFIX,
+    "HORSPOOL": SearchAlgorithm.HORSPOOL,
+}
+
+def parse_keywords(values: list[str]) -> list[str]:
+    """Accepts keywords as separate arguments and/or comma separated, like the GUI input"""
+    return [keyword.strip() for value in values for keyword in value.split(",") if keyword.strip()]
+
+def read_batch(source: TextIO) -> list[list[str]]:
+    """One keyword set per line (comma separated), blank lines and # comments are skipped"""
+    keyword_sets = []
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            keyword_sets.append(parse_keywords([line]))
+    return keyword_sets
+
+def result_to_dict(search_params: SearchParams, results: SearchResult) -> dict:
+    return {
+        "keywords": search_params.keywords,
+        "algorithm": search_params.algorithm.value,
+        "top": search_params.top_matches,
+        "cvs_scanned": results.cvs_scanned,
+        "runtime_ms": round(results.runtime, 3),
+        "fuzzy_runtime_ms": round(results.fuzzy_runtime, 3),
+        "applicants": [
+            {
+                "detail_id": applicant.detail_id,
+                "name": applicant.name,
+                "match_count": applicant.match_count,
+                "matched_keywords": applicant.matched_keywords,
+                "fuzzy_matched_keywords": applicant.fuzzy_matched_keywords or {},
+            }
+            for applicant in results.applicants
+        ],
+    }
+
+def format_result(search_params: SearchParams, results: SearchResult) -> str:
+    lines = [f"{', '.join(search_params.keywords)}: {len(results.applicants)} applicants found, "
+             f"searched {results.cvs_scanned} CVs in {results.runtime:.1f}ms"
+             + (f" (+{results.fuzzy_runtime:.1f}ms fuzzy)" if results.fuzzy_runtime else "")]
+    for rank, applicant in enumerate(results.applicants, 1):
+        matches = {**applicant.matched_keywords, **(applicant.fuzzy_matched_keywords or {})}
+        keywords = ", ".join(f"{keyword}: {count}" for keyword, count in matches.items())
+        lines.append(f"{rank:>4}. {applicant.name} (detail {applicant.detail_id}) - {applicant.match_count} matches [{keywords}]")
+    return "\n".join(lines)
+
+def run_search(args) -> int:
+    """Entry point of `main.py search`, returns the process exit code"""
+    if args.batch:
+        if args.batch == "-":
+            keyword_sets = read_batch(sys.stdin)
+        else:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                keyword_sets = read_batch(f)
+    else:
+        keyword_sets = [parse_keywords(args.keywords)]
+    keyword_sets = [keywords for keywords in keyword_sets if keywords]
+    if not keyword_sets:
+        print("No keywords given.", file=sys.stderr)
+        return 2
+
+    output = sys.stdout
+    # Progress messages of the engine and database go to stderr, stdout only carries results
+    with redirect_stdout(sys.stderr):
+        from database.backends import open_database
+        from engine.search_engine import SearchEngine
+
+        db = open_database(args.db)
+        if db.connection is None:
+            print("Database is not available.")
+            return 1
+        engine = SearchEngine(db, args.workers)
+        try:
+            # Every keyword set shares one engine: one worker pool, one warm text cache and index
+            start_time = time.time()
+            for keywords in keyword_sets:
+                search_params = SearchParams(keywords, ALGORITHMS[args.algorithm], args.top)
+                results = engine.search(search_params)
+                if args.json:
+                    # JSON Lines, so batch output can be streamed and appended
+                    output.write(json.dumps(result_to_dict(search_params, results)) + "\n")
+                else:
+                    output.write(format_result(search_params, results) + "\n\n")
+                output.flush()
+            print(f"Ran {len(keyword_sets)} searches in {time.time() - start_time:.2f}s")
+        finally:
+            engine.close()
+            db.close()
+    return 0
@@ -0,0 +1,16 @@
+BACKENDS = ("mysql", "sqlite")
+# Shown whenever the MySQL backend cannot be used, the SQLite backend needs no server
+MYSQL_UNAVAILABLE_HINT = "Run with --db sqlite to use a local SQLite database instead."
+
+def open_database(backend: str = "mysql"):
+    """
+    Creates the CVDatabase for a storage backend, both expose the same interface.
+    The backend modules (and their drivers) are only imported here, not at startup.
+    """
+    if backend == "sqlite":
+        from database.sqlite_database import SQLiteCVDatabase
+        return SQLiteCVDatabase()
+    if backend != "mysql":
+        raise ValueError(f"Unknown database backend: {backend}")
+    from database.cv_database import CVDatabase
+    return CVDatabase()
@@ -1,11 +1,17 @@
+import json
 import os
+import queue
 import re
 import socket
 import threading
 import time
-from faker import Faker
+from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-from models.search import ApplicantProfile, ApplicationDetail
+from dataclasses import asdict
+from models.search import ApplicantProfile, ApplicationDetail, CVSummaryExtraction, EducationEntry, WorkExperienceEntry
+from database.backends import MYSQL_UNAVAILABLE_HINT
+from util.inverted_index import InvertedIndex
+from util.corpus_store import CorpusStore
 
 """ SQL Queries """
 
@@ -30,6 +36,26 @@ CREATE_APPLICATION_DETAIL = '''
     );
 '''
 
+CREATE_CV_SUMMARY_EXTRACTION = '''
+    CREATE TABLE IF NOT EXISTS CVSummaryExtraction (
+        detail_id INT NOT NULL PRIMARY KEY,
+        description MEDIUMTEXT,
+        skills MEDIUMTEXT,
+        education MEDIUMTEXT,
+        work_experience MEDIUMTEXT,
+        FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+    );
+'''
+
+CREATE_CV_FINGERPRINT = '''
+    CREATE TABLE IF NOT EXISTS CVFingerprint (
+        detail_id INT NOT NULL PRIMARY KEY,
+        mtime_ns BIGINT NOT NULL,
+        size BIGINT NOT NULL,
+        FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+    );
+'''
+
 INSERT_NEW_APPLICANT_PROFILE = '''
     INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number)
     VALUES (%s, %s, %s, %s, %s);
@@ -40,6 +66,56 @@ INSERT_NEW_APPLICATION_DETAIL = '''
     VALUES (%s, %s, %s);
 '''
 
+UPSERT_CV_SUMMARY_EXTRACTION = '''
+    INSERT INTO CVSummaryExtraction (detail_id, description, skills, education, work_experience)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE description = VALUES(description), skills = VALUES(skills),
+        education = VALUES(education), work_experience = VALUES(work_experience);
+'''
+
+SELECT_CV_SUMMARY_EXTRACTION = '''
+    SELECT description, skills, education, work_experience FROM CVSummaryExtraction WHERE detail_id = %s;
+'''
+
+SELECT_APPLICATION_DETAIL_WITHOUT_SUMMARY = '''
+    SELECT ad.* FROM ApplicationDetail ad
+    LEFT JOIN CVSummaryExtraction s ON s.detail_id = ad.detail_id
+    WHERE s.detail_id IS NULL;
+'''
+
+INSERT_APPLICATION_DETAILS = '''
+    INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path)
+    VALUES {placeholders};
+'''
+
+SELECT_MAX_APPLICATION_DETAIL_ID = '''
+    SELECT COALESCE(MAX(detail_id), 0) FROM ApplicationDetail;
+'''
+
+SELECT_APPLICATION_DETAILS_SINCE = '''
+    SELECT detail_id, cv_path FROM ApplicationDetail WHERE detail_id > %s ORDER BY detail_id;
+'''
+
+UPSERT_CV_FINGERPRINT = '''
+    INSERT INTO CVFingerprint (detail_id, mtime_ns, size)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE mtime_ns = VALUES(mtime_ns), size = VALUES(size);
+'''
+
+SELECT_ALL_CV_FINGERPRINT = '''
+    SELECT ad.detail_id, ad.cv_path, f.mtime_ns, f.size FROM ApplicationDetail ad
+    LEFT JOIN CVFingerprint f ON f.detail_id = ad.detail_id
+    ORDER BY ad.detail_id;
+'''
+
+DELETE_APPLICATION_DETAILS = '''
+    DELETE FROM ApplicationDetail WHERE detail_id IN ({placeholders});
+'''
+
+DELETE_CV_SUMMARY_EXTRACTIONS = '''
+    DELETE FROM CVSummaryExtraction WHERE detail_id IN ({placeholders});
+'''
+
 SELECT_CV_PATH = '''
     SELECT cv_path FROM ApplicationDetail WHERE detail_id = %s;
 '''
@@ -56,6 +132,20 @@ SELECT_APPLICANT_PROFILE = '''
     SELECT * FROM ApplicantProfile WHERE applicant_id = %s;
 '''
 
+SELECT_ALL_APPLICANT_PROFILE_ID = '''
+    SELECT applicant_id FROM ApplicantProfile;
+'''
+
+SELECT_APPLICANT_PROFILES = '''
+    SELECT * FROM ApplicantProfile WHERE applicant_id IN ({placeholders});
+'''
+
+
+POOL_SIZE = 8          # Connections shared by the GUI thread, search threads and workers
+POOL_TIMEOUT = 10      # Seconds to wait for a free connection before giving up
+SEED_BATCH_SIZE = 500  # Rows per multi-row INSERT or DELETE when seeding
+# Index and corpus of every database go below cache/, relative to the project root
+CACHE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "cache"))
 
 try:
     import mysql.connector
@@ -67,18 +157,43 @@ except ImportError:
 class CVDatabase:
     def __init__(self):
         self.db_name = "ats_cv_hrdbawel"
-        self.connection = None
-        
+        self.connection = None  # Used for schema setup and seeding, reads go through the pool
+
+        # Pool of (connection, {query: prepared cursor}), filled on demand up to POOL_SIZE
+        self._pool: queue.LifoQueue = queue.LifoQueue()
+        self._pool_created = 0
+        self._pool_lock = threading.Lock()
+        self.open()
+
+    @property
+    def cache_dir(self) -> str:
+        """
+        Directory of this database's inverted index and corpus. Both are keyed by detail_id,
+        so every database gets its own, otherwise seeding one would overwrite another's CVs.
+        """
+        return os.path.join(CACHE_ROOT, "mysql", self.db_name)
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.cache_dir, "index.pkl")
+
+    @property
+    def corpus_dir(self) -> str:
+        return os.path.join(self.cache_dir, "corpus")
+
+    def open(self):
+        """Connects to the MySQL server and creates the database on first use"""
         if not MYSQL_AVAILABLE:
-            print("MySQL not available, using file-based mode")
+            print(f"Error: the MySQL connector is not installed. {MYSQL_UNAVAILABLE_HINT}")
             return
         
         # Check if MySQL port is open first
         print("Checking if MySQL server is running...")
         if not self._is_mysql_running():
-            print("MySQL server is not running or not accessible on localhost:3306")
+            print(f"Error: MySQL server is not running or not accessible on localhost:3306. {MYSQL_UNAVAILABLE_HINT}")
             return
             
+        cursor = None
         try:
             print("MySQL server detected. Attempting connection...")
             self.connect()
@@ -97,12 +212,15 @@ class CVDatabase:
             else:
                 cursor = self.connection.cursor()
                 cursor.execute(f"USE {self.db_name}")
+                cursor.close()
+                # Tables added after the database was first created
+                self.create_tables()
             
             print(f"Database '{self.db_name}' ready.")
             
         except Exception as err:
             print(f"Database initialization error: {err}")
-            print("Continuing in file-based mode...")
+            print(f"Error: the MySQL database could not be opened. {MYSQL_UNAVAILABLE_HINT}")
             self.connection = None
         finally:
             if cursor:
@@ -121,16 +239,24 @@ class CVDatabase:
             return False
 
     def init_database(self):
-        Faker.seed(42)  # For reproducibility
-
         cursor = self.connection.cursor()
         cursor.execute(f"CREATE DATABASE {self.db_name};")
         cursor.execute(f"USE {self.db_name};")
-        cursor.execute(CREATE_APPLICANT_PROFILE)
-        cursor.execute(CREATE_APPLICATION_DETAIL)
+        cursor.close()
+        self.create_tables()
+        self.insert_dummy_applicants()
+
+    def create_tables(self):
+        cursor = self.connection.cursor()
+        for query in (CREATE_APPLICANT_PROFILE, CREATE_APPLICATION_DETAIL, CREATE_CV_SUMMARY_EXTRACTION, CREATE_CV_FINGERPRINT):
+            cursor.execute(self._sql(query))
         self.connection.commit()
         cursor.close()
 
+    def insert_dummy_applicants(self):
+        from faker import Faker  # Only needed the first time the database is created
+        Faker.seed(42)  # For reproducibility
+
         data_cursor = self.connection.cursor()
         faker = Faker('id_ID')
         # Insert dummy data ApplocantProfile
@@ -142,7 +268,7 @@ class CVDatabase:
             address = faker.address().replace('\n', ', ')
             phone_number = faker.phone_number()
 
-            data_cursor.execute(INSERT_NEW_APPLICANT_PROFILE,
+            data_cursor.execute(self._sql(INSERT_NEW_APPLICANT_PROFILE),
                 (first_name, last_name, date_of_birth, address, phone_number)
             )
             status = data_cursor.rowcount
@@ -151,39 +277,204 @@ class CVDatabase:
         self.connection.commit()
         data_cursor.close()
                 
-    def seed_database(self, relative_data_directory, role=""):
-        import random
-        random.seed(42) # For reproducibility
+    def seed_database(self, relative_data_directory, role="", workers: int | None = None):
         if role == "":
             role = "Unknown"
-        cursor = self.connection.cursor()
+        files = [
+            (os.path.join(relative_data_directory, file), role)
+            for file in sorted(os.listdir(os.path.join(relative_data_directory)))
+            if file.endswith('.pdf')
+        ]
+        self.seed_files(files, workers)
+
+    def seed_directory(self, root_directory, workers: int | None = None):
+        """Seeds every PDF below root_directory, the role of a CV is the name of its folder (data/ACCOUNTANT/...)"""
+        self.seed_files(self._walk_cvs(root_directory), workers)
+
+    def _walk_cvs(self, root_directory) -> list[tuple[str, str]]:
+        files: list[tuple[str, str]] = []  # (cv_path, role)
+        for directory, subdirectories, filenames in os.walk(root_directory):
+            subdirectories.sort()
+            role = "Unknown" if os.path.samefile(directory, root_directory) else os.path.basename(directory)
+            files.extend((os.path.join(directory, file), role) for file in sorted(filenames) if file.endswith('.pdf'))
+        return files
+
+    def seed_files(self, files: list[tuple[str, str]], workers: int | None = None):
+        """
+        Inserts (cv_path, role) pairs with multi-row INSERTs, then extracts the text and
+        tokenizes every CV on the worker pool and adds them to the inverted index.
+        """
+        import random
+        random.seed(42) # For reproducibility
+
+        if not files:
+            print("No CVs to seed.")
+            return
+        start_time = time.time()
         applicant_ids = self.get_all_applicant_profiles_id()
-        for file in os.listdir(os.path.join(relative_data_directory)):
-            if file.endswith('.pdf'):
-                cv_path = os.path.join(relative_data_directory, file)
-                applicant_id = random.choice(applicant_ids)                
-                print(f"Seeding application detail for file: {file} with applicant_id: {applicant_id} and role: {role}")
-                cursor.execute(INSERT_NEW_APPLICATION_DETAIL, (applicant_id, role, cv_path))
+        cursor = self.connection.cursor()
+        cursor.execute(self._sql(SELECT_MAX_APPLICATION_DETAIL_ID))
+        last_id = cursor.fetchone()[0]
+        for i in range(0, len(files), SEED_BATCH_SIZE):
+            batch = files[i:i + SEED_BATCH_SIZE]
+            rows = []
+            for cv_path, role in batch:
+                rows.extend((random.choice(applicant_ids), role, cv_path))
+            cursor.execute(self._sql(INSERT_APPLICATION_DETAILS.format(placeholders=", ".join(["(%s, %s, %s)"] * len(batch)))), rows)
         self.connection.commit()
+
+        # Ids are read back rather than assumed consecutive, older rows with the same path are skipped
+        cursor.execute(self._sql(SELECT_APPLICATION_DETAILS_SINCE), (last_id,))
+        seeded_paths = {cv_path for cv_path, _ in files}
+        seeded: dict[int, str] = {}  # detail_id -> cv_path
+        for detail_id, cv_path in cursor.fetchall():
+            if cv_path in seeded_paths:
+                seeded[detail_id] = cv_path
+                seeded_paths.discard(cv_path)
         cursor.close()
+        print(f"Inserted {len(seeded)} application details in {time.time() - start_time:.2f}s")
+
+        index = InvertedIndex.load(self.index_path)
+        indexed = self._index_documents(index, seeded, workers)
+        index.term_tree()  # Build the fuzzy search vocabulary now rather than on the first search
+        index.save(self.index_path)
+        # Rows without a fingerprint count as changed, so CVs that failed here are retried by --sync
+        self._save_fingerprints(indexed)
+        print(f"Inverted index updated: {len(indexed)} CVs added, {len(index.doc_ids)} CVs and {len(index.postings)} terms in total")
+
+        elapsed = time.time() - start_time
+        print(f"Seeded {len(seeded)} CVs in {elapsed:.2f}s ({len(seeded) / max(elapsed, 1e-9):.1f} files/s)")
+
+    def sync_directory(self, root_directory, workers: int | None = None):
+        """
+        Brings the database in line with the PDFs below root_directory: new files are seeded,
+        files whose mtime or size changed get their text, index entry and summary refreshed,
+        and rows of files that no longer exist are deleted. Only the delta is processed.
+        Stale summaries are dropped here and re-extracted by extract_summaries.
+        """
+        start_time = time.time()
+        files = self._walk_cvs(root_directory)
+        on_disk: dict[str, tuple[int, int]] = {}  # normalized path -> (mtime_ns, size)
+        for cv_path, _ in files:
+            stat = os.stat(cv_path)
+            on_disk[os.path.normpath(cv_path)] = (stat.st_mtime_ns, stat.st_size)
+
+        root = os.path.abspath(root_directory)
+        known: set[str] = set()
+        changed: dict[int, str] = {}  # detail_id -> cv_path
+        deleted: list[int] = []
+        stale_texts: list[tuple[str, int, int]] = []  # (cv_path, mtime_ns, size) of text cache entries to drop
+        cursor = self.connection.cursor()
+        cursor.execute(self._sql(SELECT_ALL_CV_FINGERPRINT))
+        for detail_id, cv_path, mtime_ns, size in cursor.fetchall():
+            path = os.path.normpath(cv_path or "")
+            if os.path.commonpath([root, os.path.abspath(path)]) != root:
+                continue  # Seeded from another directory, not ours to sync
+            if path not in on_disk or path in known:
+                deleted.append(detail_id)  # Removed from disk, or a duplicate row of an earlier re-seed
+            else:
+                known.add(path)
+                if (mtime_ns, size) == on_disk[path]:
+                    continue
+                changed[detail_id] = cv_path  # Also rows seeded or indexed without a fingerprint
+            # The cached text is keyed by the fingerprint; rows without one leave their entry behind
+            if mtime_ns is not None and (path not in on_disk or (mtime_ns, size) != on_disk[path]):
+                stale_texts.append((cv_path, mtime_ns, size))
+        new_files = [(cv_path, role) for cv_path, role in files if os.path.normpath(cv_path) not in known]
+        print(f"Sync of {root_directory}: {len(new_files)} new, {len(changed)} changed, {len(deleted)} deleted, {len(known) - len(changed)} unchanged")
+
+        for i in range(0, len(deleted), SEED_BATCH_SIZE):
+            batch = deleted[i:i + SEED_BATCH_SIZE]
+            cursor.execute(self._sql(DELETE_APPLICATION_DETAILS.format(placeholders=", ".join(["%s"] * len(batch)))), batch)
+        changed_ids = list(changed)
+        for i in range(0, len(changed_ids), SEED_BATCH_SIZE):
+            batch = changed_ids[i:i + SEED_BATCH_SIZE]
+            cursor.execute(self._sql(DELETE_CV_SUMMARY_EXTRACTIONS.format(placeholders=", ".join(["%s"] * len(batch)))), batch)
+        self.connection.commit()
+        cursor.close()
+
+        if deleted or changed:
+            # The text cache is keyed by mtime and size, so changed PDFs are parsed again
+            index = InvertedIndex.load(self.index_path)
+            index.remove_documents(deleted + changed_ids)
+            CorpusStore(self.corpus_dir).remove(deleted + changed_ids)  # Changed CVs get their new text appended below
+            indexed = self._index_documents(index, changed, workers)
+            index.save(self.index_path)
+            # Only now, so a CV whose indexing failed or was interrupted is picked up by the next sync
+            self._save_fingerprints(indexed)
+
+        if stale_texts:
+            from engine.executor import get_text_cache
+            text_cache = get_text_cache()
+            for cv_path, mtime_ns, size in stale_texts:
+                text_cache.invalidate(cv_path, mtime_ns, size)
+            print(f"Dropped {len(stale_texts)} outdated text cache entries")
+
+        if new_files:
+            self.seed_files(new_files, workers)
+        print(f"Sync finished in {time.time() - start_time:.2f}s")
+
+    def _save_fingerprints(self, documents: dict[int, str]) -> None:
+        rows = []
+        for detail_id, cv_path in documents.items():
+            stat = os.stat(cv_path)
+            rows.append((detail_id, stat.st_mtime_ns, stat.st_size))
+        if rows:
+            cursor = self.connection.cursor()
+            cursor.executemany(self._sql(UPSERT_CV_FINGERPRINT), rows)
+            self.connection.commit()
+            cursor.close()
+
+    def _index_documents(self, index: InvertedIndex, documents: dict[int, str], workers: int | None = None) -> dict[int, str]:
+        """
+        Extracts the text of the CVs (detail_id -> cv_path) on the worker pool, adds them to
+        the index and appends their encoded text to the corpus store the searches scan.
+        Returns the CVs that were indexed, CVs whose text could not be extracted are skipped.
+        """
+        from engine.executor import SearchExecutor, get_text_cache, tokenize_documents
+
+        # Extract the text once now so searches never have to parse these PDFs
+        executor = SearchExecutor(workers)
+        text_cache = get_text_cache()
+        corpus_store = CorpusStore(self.corpus_dir)
+        indexed: dict[int, str] = {}
+        done = 0
+
+        def on_chunk(chunk_results: dict, chunk_size: int) -> None:
+            nonlocal done
+            for detail_id, term_positions in chunk_results.items():
+                index.add_postings(detail_id, term_positions)
+                indexed[detail_id] = documents[detail_id]
+            # The workers already wrote the text cache entries, reading them back is cheap
+            corpus_store.add({detail_id: text_cache.get_encoded(documents[detail_id], keep=False) for detail_id in chunk_results})
+            done += chunk_size
+            print(f"Extracted and indexed {done}/{len(documents)} CVs")
 
-    def _connect_with_timeout(self):
-        """Internal method to create MySQL connection with proper timeout handling"""
         try:
-            connection = mysql.connector.connect(
-                host='localhost',
-                user='root',
-                password='',
-                connect_timeout=3,  # Reduced timeout
-                autocommit=True,
-                use_pure=True,  # Force pure Python implementation
-                sql_mode='',
-                charset='utf8mb4',
-                collation='utf8mb4_unicode_ci'
-            )
-            return connection
-        except Exception as e:
-            raise e
+            executor.map(tokenize_documents, list(documents.items()), on_chunk=on_chunk)
+        finally:
+            executor.close()
+        corpus_store.compact()
+        if len(indexed) < len(documents):
+            print(f"Skipped {len(documents) - len(indexed)} CVs whose text could not be extracted")
+        return indexed
+
+    def _connect_with_timeout(self, database: str | None = None):
+        """Internal method to create MySQL connection with proper timeout handling"""
+        options = dict(
+            host='localhost',
+            user='root',
+            password='',
+            connect_timeout=3,  # Reduced timeout
+            autocommit=True,
+            sql_mode='',
+            charset='utf8mb4',
+            collation='utf8mb4_unicode_ci'
+        )
+        if database:
+            options['database'] = database
+        # The C extension is used automatically when it is installed
+        return mysql.connector.connect(**options)
 
     def connect(self):
         if not MYSQL_AVAILABLE:
@@ -195,7 +486,6 @@ class CVDatabase:
             print("- User: root")
             print("- Password: (empty)")
             print("- Timeout: 3 seconds")
-            print("- Using pure Python implementation")
             
             # Use ThreadPoolExecutor to enforce timeout
             with ThreadPoolExecutor(max_workers=1) as executor:
@@ -225,27 +515,90 @@ class CVDatabase:
             self.connection = None
 
     def close(self):
+        while True:
+            try:
+                connection, statements = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            for cursor in statements.values():
+                cursor.close()
+            connection.close()
         if self.connection and self.connection.is_connected():
             self.connection.close()
             print("Database connection closed.")
 
+    def _sql(self, query: str) -> str:
+        """Translates a query to the dialect of this backend, MySQL needs no changes"""
+        return query
+
+    """ Connection pool """
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            create = self._pool_created < POOL_SIZE
+            if create:
+                self._pool_created += 1
+        if create:
+            try:
+                return self._connect_with_timeout(self.db_name), {}
+            except Exception:
+                with self._pool_lock:
+                    self._pool_created -= 1
+                raise
+        return self._pool.get(timeout=POOL_TIMEOUT)
+
+    @contextmanager
+    def _statement(self, query: str, prepared: bool = True):
+        """
+        Borrows a pooled connection for one query. Each connection keeps one server-side
+        prepared cursor per query text, so repeated lookups skip parsing on the server.
+        """
+        connection, statements = self._acquire()
+        try:
+            if not connection.is_connected():
+                connection.reconnect(attempts=2, delay=0)
+                statements.clear()
+            if prepared:
+                cursor = statements.get(query)
+                if cursor is None:
+                    cursor = statements[query] = connection.cursor(prepared=True)
+                try:
+                    yield cursor
+                except Exception:
+                    # Do not reuse a cursor that may still hold a half-read result
+                    statements.pop(query, None)
+                    cursor.close()
+                    raise
+            else:
+                cursor = connection.cursor()
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+        finally:
+            self._pool.put((connection, statements))
+
+    def _fetch_all(self, query: str, params: tuple | list = (), prepared: bool = True) -> list[tuple]:
+        with self._statement(query, prepared) as cursor:
+            cursor.execute(self._sql(query), params)
+            return cursor.fetchall()
+
+    """ Queries """
     def get_cv_path(self, detail_id: int) -> str | None:
         if not self.connection:
             print("Database connection is not established.")
             return None
-        cursor = self.connection.cursor()
-        cursor = self.connection.cursor()
-        cursor.execute(SELECT_CV_PATH, (detail_id,))
-        result = cursor.fetchone()
-        return result[0] if result else None
+        result = self._fetch_all(SELECT_CV_PATH, (detail_id,))
+        return result[0][0] if result else None
 
     def get_all_application_details(self) -> list[ApplicationDetail]:
         if not self.connection:
             print("Database connection is not established.")
             return []
-        cursor = self.connection.cursor()
-        cursor.execute(SELECT_ALL_APPLICATION_DETAIL)
-        results = cursor.fetchall()
+        results = self._fetch_all(SELECT_ALL_APPLICATION_DETAIL)
         application_details = []
         for row in results:
             application_details.append(ApplicationDetail(
@@ -260,10 +613,9 @@ class CVDatabase:
         if not self.connection:
             print("Database connection is not established.")
             return None
-        cursor = self.connection.cursor()
-        cursor.execute(SELECT_APPLICATION_DETAIL, (detail_id,))
-        result = cursor.fetchone()
-        if result:
+        results = self._fetch_all(SELECT_APPLICATION_DETAIL, (detail_id,))
+        if results:
+            result = results[0]
             return ApplicationDetail(
                 detail_id=result[0],
                 applicant_id=result[1],
@@ -276,10 +628,9 @@ class CVDatabase:
         if not self.connection:
             print("Database connection is not established.")
             return None
-        cursor = self.connection.cursor()
-        cursor.execute(SELECT_APPLICANT_PROFILE, (applicant_id,))
-        result = cursor.fetchone()
-        if result:
+        results = self._fetch_all(SELECT_APPLICANT_PROFILE, (applicant_id,))
+        if results:
+            result = results[0]
             return ApplicantProfile(
                 applicant_id=result[0],
                 first_name=result[1],
@@ -289,15 +640,78 @@ class CVDatabase:
                 phone_number=result[5]
             )
         return None
-    
+
+    def get_applicant_profiles(self, applicant_ids: list[int]) -> dict[int, ApplicantProfile]:
+        """Fetches many profiles in one query, keyed by applicant_id. Unknown ids are left out."""
+        if not self.connection:
+            print("Database connection is not established.")
+            return {}
+        applicant_ids = list(dict.fromkeys(applicant_ids))
+        if not applicant_ids:
+            return {}
+        # The placeholder count varies per call, so this one is not worth preparing
+        query = SELECT_APPLICANT_PROFILES.format(placeholders=", ".join(["%s"] * len(applicant_ids)))
+        results = self._fetch_all(query, applicant_ids, prepared=False)
+        profiles = {}
+        for row in results:
+            profiles[row[0]] = ApplicantProfile(
+                applicant_id=row[0],
+                first_name=row[1],
+                last_name=row[2],
+                date_of_birth=row[3],
+                address=row[4],
+                phone_number=row[5]
+            )
+        return profiles
+
+    def get_application_details_without_summary(self) -> list[ApplicationDetail]:
+        if not self.connection:
+            print("Database connection is not established.")
+            return []
+        results = self._fetch_all(SELECT_APPLICATION_DETAIL_WITHOUT_SUMMARY)
+        return [ApplicationDetail(detail_id=row[0], applicant_id=row[1], application_role=row[2], cv_path=row[3]) for row in results]
+
+    def get_summary_extraction(self, detail_id: int) -> CVSummaryExtraction | None:
+        """Returns the pre-extracted summary of a CV, or None if it was not extracted yet"""
+        if not self.connection:
+            print("Database connection is not established.")
+            return None
+        results = self._fetch_all(SELECT_CV_SUMMARY_EXTRACTION, (detail_id,))
+        if not results:
+            return None
+        description, skills, education, work_experience = results[0]
+        return CVSummaryExtraction(
+            description=description or "",
+            skills=json.loads(skills or "[]"),
+            education=[EducationEntry(**entry) for entry in json.loads(education or "[]")],
+            work_experience=[WorkExperienceEntry(**entry) for entry in json.loads(work_experience or "[]")]
+        )
+
+    def save_summary_extractions(self, extractions: dict[int, CVSummaryExtraction]) -> None:
+        """Stores (or replaces) the summaries of many CVs, keyed by detail_id, in one batch"""
+        if not self.connection:
+            print("Database connection is not established.")
+            return
+        if not extractions:
+            return
+        rows = [
+            (
+                detail_id,
+                extraction.description,
+                json.dumps(extraction.skills),
+                json.dumps([asdict(entry) for entry in extraction.education]),
+                json.dumps([asdict(entry) for entry in extraction.work_experience]),
+            )
+            for detail_id, extraction in extractions.items()
+        ]
+        with self._statement(UPSERT_CV_SUMMARY_EXTRACTION, prepared=False) as cursor:
+            cursor.executemany(self._sql(UPSERT_CV_SUMMARY_EXTRACTION), rows)
+
     def get_all_applicant_profiles_id(self) -> list[int]:
         if not self.connection:
             print("Database connection is not established.")
             return []
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT applicant_id FROM ApplicantProfile")
-        results = cursor.fetchall()
-        cursor.close()
+        results = self._fetch_all(SELECT_ALL_APPLICANT_PROFILE_ID)
         return [row[0] for row in results if row[0] is not None]
         
 
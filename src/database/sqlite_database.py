@@ -0,0 +1,140 @@
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+from database.cv_database import (
+    CACHE_ROOT, CVDatabase, CREATE_APPLICANT_PROFILE, CREATE_APPLICATION_DETAIL,
+    UPSERT_CV_SUMMARY_EXTRACTION, UPSERT_CV_FINGERPRINT, SELECT_ALL_APPLICANT_PROFILE_ID,
+)
+
+""" SQLite dialect of the queries that differ from MySQL """
+
+SQLITE_CREATE_APPLICANT_PROFILE = '''
+    CREATE TABLE IF NOT EXISTS ApplicantProfile (
+        applicant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        first_name VARCHAR(50) DEFAULT NULL,
+        last_name VARCHAR(50) DEFAULT NULL,
+        date_of_birth DATE DEFAULT NULL,
+        address VARCHAR(255) DEFAULT NULL,
+        phone_number VARCHAR(20) DEFAULT NULL
+    );
+'''
+
+SQLITE_CREATE_APPLICATION_DETAIL = '''
+    CREATE TABLE IF NOT EXISTS ApplicationDetail (
+        detail_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        applicant_id INT NOT NULL,
+        application_role VARCHAR(100) DEFAULT NULL,
+        cv_path TEXT,
+        FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
+    );
+'''
+
+SQLITE_UPSERT_CV_SUMMARY_EXTRACTION = '''
+    INSERT INTO CVSummaryExtraction (detail_id, description, skills, education, work_experience)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (detail_id) DO UPDATE SET description = excluded.description, skills = excluded.skills,
+        education = excluded.education, work_experience = excluded.work_experience;
+'''
+
+SQLITE_UPSERT_CV_FINGERPRINT = '''
+    INSERT INTO CVFingerprint (detail_id, mtime_ns, size)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (detail_id) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size;
+'''
+
+# The MySQL tables are created without secondary indexes, SQLite gets the ones the lookups use
+SQLITE_CREATE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_application_detail_applicant ON ApplicationDetail(applicant_id);",
+    "CREATE INDEX IF NOT EXISTS idx_application_detail_cv_path ON ApplicationDetail(cv_path);",
+]
+
+SQLITE_QUERIES = {
+    CREATE_APPLICANT_PROFILE: SQLITE_CREATE_APPLICANT_PROFILE,
+    CREATE_APPLICATION_DETAIL: SQLITE_CREATE_APPLICATION_DETAIL,
+    UPSERT_CV_SUMMARY_EXTRACTION: SQLITE_UPSERT_CV_SUMMARY_EXTRACTION,
+    UPSERT_CV_FINGERPRINT: SQLITE_UPSERT_CV_FINGERPRINT,
+}
+
+# Database file next to data/, relative to the project root
+DEFAULT_SQLITE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "ats_cv_hrdbawel.sqlite3"))
+
+# Dates go in as ISO strings and come back as date objects, like the MySQL connector returns them
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+
+class SQLiteCVDatabase(CVDatabase):
+    """
+    CVDatabase stored in a local SQLite file instead of a MySQL server. Queries run in-process,
+    so there is no server to probe at startup and no network round trip per lookup.
+    The file is in WAL mode, so search threads can read while seeding writes.
+    """
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        super().__init__()
+
+    @property
+    def cache_dir(self) -> str:
+        # Named after a hash of the absolute path, so each SQLite file has its own index and corpus
+        key = hashlib.sha1(os.path.abspath(self.path).encode()).hexdigest()[:12]
+        return os.path.join(CACHE_ROOT, "sqlite", key)
+
+    def open(self):
+        try:
+            is_new = not os.path.exists(self.path)
+            self.connection = self._connect_with_timeout()
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.create_tables()
+            cursor = self.connection.cursor()
+            for query in SQLITE_CREATE_INDEXES:
+                cursor.execute(query)
+            cursor.execute(self._sql(SELECT_ALL_APPLICANT_PROFILE_ID))
+            has_applicants = cursor.fetchone() is not None
+            self.connection.commit()
+            cursor.close()
+            if not has_applicants:
+                print(f"Database {self.path} has no applicants. Initializing...")
+                self.insert_dummy_applicants()
+            print(f"SQLite database '{self.path}' ready{' (created)' if is_new else ''}.")
+        except sqlite3.Error as err:
+            print(f"Database initialization error: {err}")
+            self.connection = None
+
+    def _connect_with_timeout(self, database: str | None = None):
+        # Pooled connections are handed between threads, but only ever used by one at a time
+        connection = sqlite3.connect(self.path, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, and no fsync per commit
+        return connection
+
+    def _sql(self, query: str) -> str:
+        return SQLITE_QUERIES.get(query, query).replace("%s", "?")
+
+    @contextmanager
+    def _statement(self, query: str, prepared: bool = True):
+        # sqlite3 keeps its own per-connection cache of compiled statements
+        connection, statements = self._acquire()
+        try:
+            cursor = connection.cursor()
+            try:
+                yield cursor
+                if connection.in_transaction:
+                    connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            self._pool.put((connection, statements))
+
+    def close(self):
+        while not self._pool.empty():
+            connection, _ = self._pool.get_nowait()
+            connection.close()
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+            print("Database connection closed.")
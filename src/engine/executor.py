@@ -0,0 +1,204 @@
+import multiprocessing
+import os
+import re
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from models.search import SearchAlgorithm
+from lib.kmp import MultiKMP
+from lib.bm import BoyerMoore, CommentzWalter, Horspool
+from lib.aho_corasick import AhoCorasick
+from lib.levenshtein import count_similar
+from util.corpus_store import CorpusStore
+from util.text_cache import TextCache
+from util.inverted_index import InvertedIndex
+
+SIMILARITY_THRESHOLD = 80.0
+PARALLEL_THRESHOLD = 32  # Below this many CVs, pickling work to the pool costs more than scanning in-process
+SERIAL_CHUNK_SIZE = 16   # In-process scans still report back every few CVs for progress and cancellation
+
+# Multi-pattern variants that scan each CV once for all keywords
+scanner_classes = {
+    SearchAlgorithm.KMP: MultiKMP,
+    SearchAlgorithm.BM: CommentzWalter,
+    SearchAlgorithm.AHO_CORASICK: AhoCorasick,
+}
+
+# Algorithms whose per-keyword tables are built once per query and reused for every CV
+matcher_classes = {
+    SearchAlgorithm.BM_GOOD_SUFFIX: BoyerMoore,
+    SearchAlgorithm.HORSPOOL: Horspool,
+}
+
+# (detail_id, cv_path) pairs, the unit of work sent to the workers
+Documents = list[tuple[int, str]]
+# (detail_id, cv_path, keywords) when each CV needs a different set of keywords scanned
+ScanJobs = list[tuple[int, str, tuple[str, ...]]]
+# detail_id -> {keyword: count}
+DocumentMatches = dict[int, dict[str, int]]
+# Where the scanned CV texts came from: the corpus store, or text cache hits and misses
+ReadStats = dict[str, int]
+ChunkResult = TypeVar("ChunkResult")
+
+@lru_cache(maxsize=32)
+def compile_scanner(algorithm: SearchAlgorithm, keywords: tuple[str, ...]) -> MultiKMP | CommentzWalter | AhoCorasick:
+    """Builds the multi-pattern automaton once per keyword set instead of once per CV"""
+    return scanner_classes[algorithm](list(keywords))
+
+@lru_cache(maxsize=32)
+def compile_matchers(algorithm: SearchAlgorithm, keywords: tuple[str, ...]) -> tuple:
+    """Builds the shift tables of every keyword once per keyword set instead of once per CV"""
+    matcher_class = matcher_classes[algorithm]
+    return tuple(matcher_class(keyword) for keyword in keywords)
+
+def match_keywords(algorithm: SearchAlgorithm, text: str, keywords: list[str]) -> dict[str, list[int]]:
+    """Runs the chosen algorithm for every keyword, returning {keyword: [start indices]}."""
+    if algorithm in scanner_classes:
+        return compile_scanner(algorithm, tuple(keywords)).scan(text)
+    return {matcher.pattern: matcher.search(text) for matcher in compile_matchers(algorithm, tuple(keywords))}
+
+def count_keywords(algorithm: SearchAlgorithm, text: str | bytes | memoryview, keywords: list[str]) -> dict[str, int]:
+    """
+    Like match_keywords, but only counts the occurrences instead of collecting their positions.
+    text may also be the encoded form kept by the text cache or the corpus store, which the
+    matchers scan with dense tables.
+    """
+    encoded = not isinstance(text, str)
+    if algorithm in scanner_classes:
+        scanner = compile_scanner(algorithm, tuple(keywords))
+        return scanner.count_encoded(text) if encoded else scanner.count(text)
+    matchers = compile_matchers(algorithm, tuple(keywords))
+    if encoded:
+        return {matcher.pattern: matcher.count_encoded(text) for matcher in matchers}
+    return {matcher.pattern: matcher.count(text) for matcher in matchers}
+
+""" Worker functions, module level so they can be pickled to the process pool """
+_text_cache: TextCache | None = None
+_corpus_stores: dict[str, CorpusStore] = {}  # corpus directory -> store, one per database
+
+def get_text_cache() -> TextCache:
+    """One text cache per process, shared by every search that process runs"""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
+
+def get_corpus_store(directory: str) -> CorpusStore:
+    """One corpus map per database and process, refreshed so CVs seeded since the last search are found"""
+    corpus_store = _corpus_stores.get(directory)
+    if corpus_store is None:
+        corpus_store = _corpus_stores[directory] = CorpusStore(directory)
+    else:
+        corpus_store.refresh()
+    return corpus_store
+
+def new_read_stats() -> ReadStats:
+    return {"corpus": 0, "hits": 0, "misses": 0}
+
+def add_read_stats(total: ReadStats, stats: ReadStats) -> None:
+    for source, count in stats.items():
+        total[source] += count
+
+def get_encoded_text(corpus_store: CorpusStore, detail_id: int, cv_path: str, stats: ReadStats) -> bytes | memoryview:
+    """The CV text straight from the mapped corpus, or from the text cache for CVs seeded before it existed"""
+    text = corpus_store.get(detail_id)
+    if text is None:
+        return get_text_cache().get_encoded(cv_path, stats=stats)
+    stats["corpus"] += 1
+    return text
+
+def scan_exact(jobs: ScanJobs, algorithm: SearchAlgorithm, corpus_dir: str) -> tuple[DocumentMatches, ReadStats]:
+    """Also returns how the CV texts were read, the text cache of a worker process is not the caller's"""
+    corpus_store = get_corpus_store(corpus_dir)
+    stats = new_read_stats()
+    results: DocumentMatches = {}
+    for detail_id, cv_path, keywords in jobs:
+        cv_text = get_encoded_text(corpus_store, detail_id, cv_path, stats)
+        exact_matches = {keyword: count for keyword, count in count_keywords(algorithm, cv_text, list(keywords)).items() if count}
+        if exact_matches:
+            results[detail_id] = exact_matches
+    return results, stats
+
+def scan_fuzzy(documents: Documents, keywords: list[str], corpus_dir: str) -> tuple[DocumentMatches, ReadStats]:
+    corpus_store = get_corpus_store(corpus_dir)
+    stats = new_read_stats()
+    results: DocumentMatches = {}
+    for detail_id, cv_path in documents:
+        cv_text = get_encoded_text(corpus_store, detail_id, cv_path, stats)
+        fuzzy_matches: dict[str, int] = {}
+        # The words are ASCII, so only the distinct ones are decoded
+        words_in_cv = [word.decode("ascii") for word in set(re.findall(rb'[a-z]+', cv_text))]
+        for keyword in keywords:
+            # All words of the CV are scored at once (vectorized when numpy is installed)
+            count = count_similar(keyword, words_in_cv, SIMILARITY_THRESHOLD)
+            if count:
+                fuzzy_matches[keyword] = count
+        if fuzzy_matches:
+            results[detail_id] = fuzzy_matches
+    return results, stats
+
+def tokenize_documents(documents: Documents) -> dict[int, dict[str, array]]:
+    """
+    Extracts (and caches) the text of each CV and tokenizes it for the inverted index.
+    A CV that cannot be parsed is reported and left out, so one broken PDF does not stop the rest.
+    """
+    text_cache = get_text_cache()
+    results: dict[int, dict[str, array]] = {}
+    for detail_id, cv_path in documents:
+        try:
+            results[detail_id] = InvertedIndex.tokenize(text_cache.get_text(cv_path))
+        except Exception as e:
+            print(f"Could not extract text of {cv_path}: {e}")
+    return results
+
+class SearchExecutor:
+    """
+    Splits a list of CVs into chunks and scans them on a pool of worker processes.
+    The pool is created on first use and reused by later searches.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def map(self, function: Callable[..., ChunkResult], documents: list, *args, on_chunk: Callable[[ChunkResult, int], None]) -> None:
+        """
+        Runs function(chunk, *args) over all documents and calls on_chunk(chunk_result, chunk_size)
+        as every chunk completes; an exception raised from it (e.g. a cancelled search) stops
+        the remaining chunks.
+        """
+        if self.workers <= 1 or len(documents) < PARALLEL_THRESHOLD:
+            for i in range(0, len(documents), SERIAL_CHUNK_SIZE):
+                chunk = documents[i:i + SERIAL_CHUNK_SIZE]
+                on_chunk(function(chunk, *args), len(chunk))
+            return
+
+        with self._lock:
+            if self._pool is None:
+                print(f"Starting search pool with {self.workers} workers")
+                # The pool is created from a search thread while Qt and the startup/summary threads run;
+                # forking then can copy a held lock into the child, so workers are spawned instead
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+        # A few chunks per worker keeps the load balanced when some CVs are much longer
+        chunk_size = -(-len(documents) // (self.workers * 4))
+        futures = {
+            self._pool.submit(function, documents[i:i + chunk_size], *args): len(documents[i:i + chunk_size])
+            for i in range(0, len(documents), chunk_size)
+        }
+        try:
+            for future in as_completed(futures):
+                on_chunk(future.result(), futures[future])
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
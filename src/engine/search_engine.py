@@ -0,0 +1,275 @@
+import time
+from typing import Callable
+from models.search import SearchParams, ApplicantMatchData, ApplicationDetail, SearchResult
+from engine.executor import SIMILARITY_THRESHOLD, SearchExecutor, DocumentMatches, ReadStats, ScanJobs, add_read_stats, get_text_cache, match_keywords, new_read_stats, scan_exact, scan_fuzzy
+from engine.top_k import TopK
+from util.inverted_index import InvertedIndex
+
+PARTIAL_RESULTS_INTERVAL = 0.25  # Seconds between two partial result updates
+
+def normalize_keywords(keywords: list[str]) -> dict[str, str]:
+    """Maps each distinct lowercase keyword to the keyword as typed by the user"""
+    keyword_map: dict[str, str] = {}
+    for keyword in keywords:
+        keyword_lower = keyword.strip().lower()
+        if keyword_lower and keyword_lower not in keyword_map:
+            keyword_map[keyword_lower] = keyword
+    return keyword_map
+
+def applicant_ids_of(applications: list[ApplicationDetail]) -> dict[int, int]:
+    """detail_id -> applicant_id, so result assembly never scans the application list"""
+    return {app.detail_id: app.applicant_id for app in applications}
+
+class SearchCancelled(Exception):
+    """Raised out of SearchEngine.search when the caller cancels the search"""
+
+class SearchMonitor:
+    """
+    Progress reporting and cancellation for one search. Every callback is optional:
+    on_progress(scanned, total), on_partial_results(SearchResult) and is_cancelled().
+    """
+
+    def __init__(self, on_progress: Callable[[int, int], None] | None = None,
+                 on_partial_results: Callable[[SearchResult], None] | None = None,
+                 is_cancelled: Callable[[], bool] | None = None):
+        self.on_progress = on_progress
+        self.on_partial_results = on_partial_results
+        self.is_cancelled = is_cancelled
+        self.scanned = 0
+        self.total = 0
+        self.last_partial = 0.0
+
+    def check(self) -> None:
+        if self.is_cancelled and self.is_cancelled():
+            raise SearchCancelled()
+
+    def start_pass(self, total: int, scanned: int = 0) -> None:
+        self.total = total
+        self.scanned = 0
+        self.advance(scanned)
+
+    def advance(self, scanned: int) -> None:
+        self.check()
+        self.scanned += scanned
+        if self.on_progress:
+            self.on_progress(self.scanned, self.total)
+
+    def wants_partial_results(self) -> bool:
+        if not self.on_partial_results:
+            return False
+        now = time.time()
+        if now - self.last_partial < PARTIAL_RESULTS_INTERVAL:
+            return False
+        self.last_partial = now
+        return True
+
+class SearchEngine:
+    """
+    Keyword search over every CV in the database, independent of the GUI.
+    Exact matches come from the inverted index where possible, everything that
+    still needs a full scan is fanned out to the SearchExecutor.
+    """
+
+    def __init__(self, db, workers: int | None = None):
+        self.db = db
+        self.text_cache = get_text_cache()
+        self.index = InvertedIndex.load(db.index_path)
+        self.executor = SearchExecutor(workers)
+        self.read_stats = new_read_stats()  # Summed over the scans of the current search, including the workers'
+        self._names: dict[int, str | None] = {}  # applicant_id -> name, reset for every search
+        print(f"Inverted index loaded with {len(self.index.doc_ids)} CVs")
+
+    def search(self, search_params: SearchParams, monitor: SearchMonitor | None = None) -> SearchResult:
+        monitor = monitor or SearchMonitor()
+        search_results = SearchResult(applicants=[], cvs_scanned=0, runtime=0)
+        applications = self.db.get_all_application_details()
+        self.read_stats = new_read_stats()
+        self._names = {}
+
+        app_matches = self.exact_search(search_params, search_results, applications, monitor)
+
+        if not app_matches:
+            self.fuzzy_search(search_params, search_results, applications, app_matches, monitor)
+
+        search_results.applicants = self.rank(app_matches, applicant_ids_of(applications), search_params.top_matches)
+        print(f"CV texts read: {self.read_stats}")
+        return search_results
+
+    def rank(self, app_matches: dict[int, ApplicantMatchData], applicant_ids: dict[int, int], top_matches: int) -> list[ApplicantMatchData]:
+        """
+        Returns the best top_matches results (all if top_matches <= 0) with their applicant names.
+        Only the selected results are looked up, applicant_ids maps detail_id -> applicant_id
+        and all missing names are fetched in one query.
+        """
+        top = TopK(top_matches)
+        for match_data in app_matches.values():
+            top.push(match_data.match_count, match_data)
+        selected = top.items()
+
+        missing = {applicant_ids.get(match_data.detail_id, -1) for match_data in selected} - self._names.keys()
+        if missing:
+            profiles = self.db.get_applicant_profiles(list(missing))
+            for applicant_id in missing:
+                profile = profiles.get(applicant_id)
+                self._names[applicant_id] = f"{profile.first_name} {profile.last_name}" if profile else None
+
+        ranked = []
+        for match_data in selected:
+            name = self._names[applicant_ids.get(match_data.detail_id, -1)]
+            if name is not None:
+                match_data.name = name
+                ranked.append(match_data)
+        return ranked
+
+    @staticmethod
+    def select_top(scores: dict[int, int], top_matches: int, to_match_data: Callable[[int], ApplicantMatchData]) -> dict[int, ApplicantMatchData]:
+        """
+        Builds ApplicantMatchData only for the top_matches best detail_id -> score entries,
+        so result assembly does not grow with the number of matched CVs.
+        """
+        top = TopK(top_matches)
+        for detail_id, score in scores.items():
+            if top.accepts(score):
+                top.push(score, detail_id)
+        return {detail_id: to_match_data(detail_id) for detail_id in top.items()}
+
+    def _emit_partial_results(self, monitor: SearchMonitor, search_params: SearchParams, applications: list[ApplicationDetail], app_matches: dict[int, ApplicantMatchData]) -> None:
+        partial = SearchResult(applicants=[], cvs_scanned=monitor.scanned, runtime=0)
+        partial.applicants = self.rank(app_matches, applicant_ids_of(applications), search_params.top_matches)
+        monitor.on_partial_results(partial)
+
+    def exact_search(self, search_params: SearchParams, search_results: SearchResult, applications: list[ApplicationDetail], monitor: SearchMonitor | None = None) -> dict[int, ApplicantMatchData]:
+        print(f"Performing exact search with parameters: {search_params}")
+        monitor = monitor or SearchMonitor()
+
+        keyword_map = normalize_keywords(search_params.keywords)
+        patterns = list(keyword_map)
+        algorithm = search_params.algorithm
+        match = lambda text, keywords: match_keywords(algorithm, text, keywords)
+
+        counts: DocumentMatches = {}
+        start_time = time.time()
+
+        def merge(document_matches: DocumentMatches) -> None:
+            for detail_id, keyword_counts in document_matches.items():
+                counts.setdefault(detail_id, {}).update(keyword_counts)
+
+        def to_match_data(detail_id: int) -> ApplicantMatchData:
+            exact_matches = {keyword_map[p]: counts[detail_id][p] for p in patterns if p in counts[detail_id]}
+            return ApplicantMatchData(
+                detail_id=detail_id,
+                name="",  # Filled later
+                match_count = sum(exact_matches.values()),
+                matched_keywords=exact_matches,
+            )
+
+        # Keywords each CV still has to be scanned for after the index lookup
+        scan_keywords: dict[int, list[str]] = {}
+        indexed_ids = {app.detail_id for app in applications if app.detail_id in self.index.doc_ids}
+
+        if indexed_ids and patterns:
+            words = [p for p in patterns if self.index.is_term_query(p)]
+            phrases = [p for p in patterns if not self.index.is_term_query(p)]
+
+            # Single words are answered from the posting lists
+            for keyword, doc_counts in self.index.count_keywords(words, match).items():
+                merge({detail_id: {keyword: count} for detail_id, count in doc_counts.items() if detail_id in indexed_ids})
+
+            # Phrases are verified with the matcher on candidate CVs only
+            for phrase in phrases:
+                candidate_ids = self.index.candidates(phrase, match)
+                for detail_id in indexed_ids if candidate_ids is None else candidate_ids & indexed_ids:
+                    scan_keywords.setdefault(detail_id, []).append(phrase)
+
+        # CVs seeded before the index existed are still scanned fully
+        if patterns:
+            for app in applications:
+                if app.detail_id not in indexed_ids:
+                    scan_keywords[app.detail_id] = patterns
+
+        jobs: ScanJobs = [(app.detail_id, app.cv_path, tuple(scan_keywords[app.detail_id])) for app in applications if app.detail_id in scan_keywords]
+        monitor.start_pass(len(applications), len(applications) - len(jobs))
+
+        def on_chunk(chunk_result: tuple[DocumentMatches, ReadStats], chunk_size: int) -> None:
+            chunk_results, read_stats = chunk_result
+            add_read_stats(self.read_stats, read_stats)
+            merge(chunk_results)
+            monitor.advance(chunk_size)
+            if monitor.wants_partial_results():
+                scores = {detail_id: sum(keyword_counts.values()) for detail_id, keyword_counts in counts.items()}
+                self._emit_partial_results(monitor, search_params, applications, self.select_top(scores, search_params.top_matches, to_match_data))
+
+        self.executor.map(scan_exact, jobs, algorithm, self.db.corpus_dir, on_chunk=on_chunk)
+
+        # Only the best top_matches CVs become results, in application order for equal counts
+        scores = {app.detail_id: sum(counts[app.detail_id].values()) for app in applications if app.detail_id in counts}
+        final_results = self.select_top(scores, search_params.top_matches, to_match_data)
+        end_time = time.time()
+
+        search_results.cvs_scanned = len(applications)
+        search_results.runtime = (end_time - start_time) * 1000
+        return final_results
+
+    def fuzzy_search(self, search_params: SearchParams, search_results: SearchResult, applications: list[ApplicationDetail], previous_matches: dict[int, ApplicantMatchData], monitor: SearchMonitor | None = None) -> None:
+        print(f"Performing fuzzy search with parameters: {search_params}")
+        monitor = monitor or SearchMonitor()
+
+        keyword_map = normalize_keywords(search_params.keywords)
+        start_time = time.time()
+
+        fuzzy_results: DocumentMatches = {}
+
+        def to_fuzzy_matches(detail_id: int) -> dict[str, int]:
+            return {keyword_map[k]: count for k, count in fuzzy_results[detail_id].items()}
+
+        def on_chunk(chunk_result: tuple[DocumentMatches, ReadStats], chunk_size: int) -> None:
+            chunk_results, read_stats = chunk_result
+            add_read_stats(self.read_stats, read_stats)
+            fuzzy_results.update(chunk_results)
+            monitor.advance(chunk_size)
+            if monitor.wants_partial_results():
+                def to_match_data(detail_id: int) -> ApplicantMatchData:
+                    fuzzy_matches = to_fuzzy_matches(detail_id)
+                    return ApplicantMatchData(detail_id, "", sum(fuzzy_matches.values()), {}, fuzzy_matches)
+                scores = {detail_id: sum(keyword_counts.values()) for detail_id, keyword_counts in fuzzy_results.items()}
+                self._emit_partial_results(monitor, search_params, applications, self.select_top(scores, search_params.top_matches, to_match_data))
+
+        # Similar words of indexed CVs come from the vocabulary BK-tree, the rest is scanned
+        indexed_ids = {app.detail_id for app in applications if app.detail_id in self.index.doc_ids}
+        if indexed_ids and keyword_map:
+            for keyword, doc_counts in self.index.fuzzy_counts(list(keyword_map), SIMILARITY_THRESHOLD).items():
+                for detail_id, count in doc_counts.items():
+                    if detail_id in indexed_ids:
+                        fuzzy_results.setdefault(detail_id, {})[keyword] = count
+
+        documents = [(app.detail_id, app.cv_path) for app in applications if app.detail_id not in indexed_ids]
+        monitor.start_pass(len(applications), len(applications) - len(documents))
+        if keyword_map and documents:
+            self.executor.map(scan_fuzzy, documents, list(keyword_map), self.db.corpus_dir, on_chunk=on_chunk)
+
+        # Merge in application order so the ranking does not depend on which worker finished first
+        for app in applications:
+            detail_id = app.detail_id
+            if detail_id not in fuzzy_results:
+                continue
+            fuzzy_matches = to_fuzzy_matches(detail_id)
+            if detail_id in previous_matches:
+                match_data = previous_matches[detail_id]
+                match_data.match_count += sum(fuzzy_matches.values())
+                match_data.fuzzy_matched_keywords = fuzzy_matches
+            else:
+                match_data = ApplicantMatchData(
+                    detail_id=detail_id,
+                    name="",  # Filled later
+                    match_count=sum(fuzzy_matches.values()),
+                    matched_keywords={},
+                    fuzzy_matched_keywords=fuzzy_matches
+                )
+                previous_matches[detail_id] = match_data
+        end_time = time.time()
+
+        search_results.cvs_scanned = len(applications)
+        search_results.fuzzy_runtime = (end_time - start_time) * 1000
+
+    def close(self) -> None:
+        self.executor.close()
@@ -0,0 +1,39 @@
+import heapq
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+class TopK(Generic[T]):
+    """
+    Keeps the k highest scoring items pushed so far in a bounded min-heap, so memory stays
+    O(k) however many items are pushed. Ties go to the item pushed first, which makes the
+    result identical to a stable sort by score (descending) followed by a [:k] slice.
+    k <= 0 keeps every item.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: list[tuple[int | float, int, T]] = []  # (score, -push order, item), worst at [0]
+        self._pushed = 0
+
+    def accepts(self, score: int | float) -> bool:
+        """True if an item with this score pushed now would be kept, to skip building rejected items"""
+        if self.k <= 0 or len(self._heap) < self.k:
+            return True
+        # An equal score loses against the earlier item already in the heap
+        return score > self._heap[0][0]
+
+    def push(self, score: int | float, item: T) -> None:
+        entry = (score, -self._pushed, item)
+        self._pushed += 1
+        if self.k <= 0 or len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> list[T]:
+        """The kept items, best first"""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QButtonGroup, QRadioButton
+from PyQt6.QtWidgets import QWidget, QGridLayout, QButtonGroup, QRadioButton
 from PyQt6.QtCore import Qt
 from models.search import SearchAlgorithm
 
@@ -15,14 +15,15 @@ class AlgorithmButtons(QWidget):
         self.group = QButtonGroup(self)
         self.group.setExclusive(True)
 
-        self.layout = QHBoxLayout(self)
+        # Rows of three, five algorithms do not fit next to each other in the left panel
+        self.layout = QGridLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(5)
         
         for id, choice in enumerate(SearchAlgorithm):
             button = PillButton(choice.value, self)
             self.group.addButton(button, id)
-            self.layout.addWidget(button) 
+            self.layout.addWidget(button, id // 3, id % 3) 
             if id == 0:
                 button.setChecked(True)
         
@@ -5,6 +5,7 @@ from models.search import SearchParams
 
 class InputFields(QWidget):
     search_initiate = pyqtSignal(SearchParams)   # Search button signal
+    keywords_changed = pyqtSignal()              # Keywords edited, a running search is outdated
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -39,6 +40,7 @@ class InputFields(QWidget):
         font_metrics = self.keywords_input.fontMetrics()
         vertical_padding = 20
         self.keywords_input.setMaximumHeight(vertical_padding + font_metrics.lineSpacing() * 2)  # Limit to 2 lines
+        self.keywords_input.textChanged.connect(self.keywords_changed)
         layout.addWidget(self.keywords_input)
 
         algorithm_label = QLabel(text="Search Algorithm")
@@ -111,6 +111,25 @@ class ResultDisplay(QWidget):
         self.stack.setCurrentWidget(self.blank_page)
         print("Cleared results and switched to blank page.")
     
+    def show_status(self, status: str) -> None:
+        # Only the blank page has room for a status line, results stay untouched
+        if self.stack.currentWidget() is self.blank_page:
+            self.blank_sublabel.setText(status)
+
+    def show_searching(self) -> None:
+        self.blank_label.setText("Searching...")
+        self.blank_sublabel.setText("")
+        self.stack.setCurrentWidget(self.blank_page)
+
+    def show_progress(self, scanned: int, total: int) -> None:
+        progress_text = f"scanning {scanned} / {total} CVs..."
+        if self.stack.currentWidget() is self.result_page:
+            # Partial results are shown, keep them and only update the statistics line
+            self.search_statistics.setText(progress_text)
+        else:
+            self.blank_label.setText("Searching...")
+            self.blank_sublabel.setText(progress_text)
+
     def display_results(self) -> None:
         if self.page_count == 0 or self.current_page == 0:
             self.clear_results(True)
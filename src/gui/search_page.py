@@ -6,6 +6,7 @@ from models.search import SearchParams, SearchResult
 
 class SearchPage(QWidget):
     search_initiate = pyqtSignal(SearchParams)  # Signal to initiate search with parameters
+    search_cancel = pyqtSignal()                # Signal to cancel the running search
     view_summary = pyqtSignal(int)  # Signal to view summary
     view_cv = pyqtSignal(int)       # Signal to view CV (launch a window with the CV PDF)
 
@@ -43,6 +44,7 @@ class SearchPage(QWidget):
         # Input fields in the left panel
         input_fields = InputFields(left_panel)
         input_fields.search_initiate.connect(self.search_initiate)
+        input_fields.keywords_changed.connect(self.search_cancel)
 
         # Result display in the right panel
         self.result_display = ResultDisplay(right_panel)
@@ -55,4 +57,15 @@ class SearchPage(QWidget):
     def show_results(self, results: SearchResult) -> None:
         self.result_display.set_results(results)
         self.result_display.display_results()
-        
\ No newline at end of file
+
+    def show_search_started(self) -> None:
+        self.result_display.show_searching()
+
+    def clear_results(self) -> None:
+        self.result_display.clear_results()
+
+    def show_progress(self, scanned: int, total: int) -> None:
+        self.result_display.show_progress(scanned, total)
+
+    def show_status(self, status: str) -> None:
+        self.result_display.show_status(status)
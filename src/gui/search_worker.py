@@ -0,0 +1,43 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from engine.search_engine import SearchEngine, SearchMonitor, SearchCancelled
+from models.search import SearchParams, SearchResult
+
+class SearchWorker(QObject):
+    """Runs one SearchEngine.search on a QThread so the GUI stays responsive"""
+    progress = pyqtSignal(int, int)              # CVs scanned, total CVs
+    partial_results = pyqtSignal(SearchResult)   # Best results found so far
+    finished = pyqtSignal(SearchResult)          # Final results
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+    done = pyqtSignal()                          # Emitted last, whatever the outcome
+
+    def __init__(self, engine: SearchEngine, search_params: SearchParams):
+        super().__init__()
+        self.engine = engine
+        self.search_params = search_params
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        # Only read by the worker thread between chunks, a plain flag is enough
+        self._cancelled = True
+
+    def run(self) -> None:
+        monitor = SearchMonitor(
+            on_progress=self.progress.emit,
+            on_partial_results=self.partial_results.emit,
+            is_cancelled=lambda: self._cancelled,
+        )
+        try:
+            results = self.engine.search(self.search_params, monitor)
+            if self._cancelled:
+                self.cancelled.emit()
+            else:
+                self.finished.emit(results)
+        except SearchCancelled:
+            print(f"Search cancelled: {self.search_params}")
+            self.cancelled.emit()
+        except Exception as e:
+            print(f"Search failed: {e}")
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
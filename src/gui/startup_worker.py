@@ -0,0 +1,55 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from database.backends import MYSQL_UNAVAILABLE_HINT, open_database
+from engine.search_engine import SearchEngine
+from util import startup_profile
+
+class StartupWorker(QObject):
+    """Connects to the database and loads the search engine on a QThread, so the window shows at once"""
+    status = pyqtSignal(str)
+    ready = pyqtSignal(object, object)  # CVDatabase, SearchEngine
+    failed = pyqtSignal(str)
+    done = pyqtSignal()                 # Emitted last, whatever the outcome
+
+    def __init__(self, backend: str, workers: int | None = None):
+        super().__init__()
+        self.backend = backend
+        self.workers = workers
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        # Stops the cache warming, connecting itself is bounded by the connection timeouts
+        self._cancelled = True
+
+    def run(self) -> None:
+        try:
+            self.status.emit("Connecting to database...")
+            db = open_database(self.backend)
+            if db.connection is None:
+                # Searching a database without a connection would only ever find nothing
+                raise RuntimeError(f"MySQL is not available. {MYSQL_UNAVAILABLE_HINT}" if self.backend == "mysql" else "could not open the database")
+            startup_profile.mark("database connected")
+            self.status.emit("Loading search index...")
+            engine = SearchEngine(db, self.workers)
+            startup_profile.mark("search engine loaded")
+            self.ready.emit(db, engine)
+
+            # Anything the first search would otherwise pay for
+            self.warm(db, engine)
+            startup_profile.mark("caches warmed")
+        except Exception as e:
+            print(f"Startup failed: {e}")
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
+
+    def warm(self, db, engine: SearchEngine) -> None:
+        if db.connection is None:
+            return
+        # CVs missing from the index are the ones a search still scans in this process
+        for app in db.get_all_application_details():
+            if self._cancelled:
+                return
+            if app.detail_id not in engine.index.doc_ids:
+                engine.text_cache.get_encoded(app.cv_path)
+        if engine.index.doc_ids:
+            engine.index.term_tree()
@@ -1,4 +1,6 @@
+from array import array
 from collections import deque
+from lib.encoding import ReducedAlphabet, encode_text
 
 def build_trie(patterns: list[str]) -> tuple[list[dict], list[list[str]]]:
     """
@@ -65,6 +67,173 @@ def build_failure_links(goto: list[dict], output: list[list[str]]) -> list[int]:
 
     return failure
 
+def build_dfa(goto: list[dict], failure: list[int], columns: dict, width: int) -> array:
+    """
+    Menggabungkan goto dan failure links menjadi DFA lengkap dalam tabel datar:
+    delta[state * width + kolom] -> next_state. columns memetakan simbol pola ke kolomnya;
+    kolom yang tidak dipakai simbol mana pun tetap 0, yaitu kembali ke root.
+    """
+    delta = array('i', [0]) * (len(goto) * width)
+
+    # Bangun DFA secara BFS agar transisi state failure sudah lengkap lebih dulu
+    queue = deque()
+    for symbol, column in columns.items():
+        next_state = goto[0].get(symbol, 0)
+        delta[column] = next_state
+        if next_state != 0:
+            queue.append(next_state)
+    while queue:
+        state = queue.popleft()
+        base = state * width
+        failure_base = failure[state] * width
+        for symbol, column in columns.items():
+            next_state = goto[state].get(symbol)
+            if next_state is None:
+                delta[base + column] = delta[failure_base + column]
+            else:
+                delta[base + column] = next_state
+                queue.append(next_state)
+    return delta
+
+class AhoCorasick:
+    """
+    Automaton Aho-Corasick yang dikompilasi sekali dari daftar pola, lalu dapat
+    dipakai untuk scan(text) berkali-kali (misalnya untuk setiap CV dalam satu pencarian).
+
+    Fungsi goto dan failure links digabung menjadi satu DFA lengkap yang disimpan
+    dalam tabel datar: delta[state * sigma + kolom] -> next_state, dengan sigma adalah
+    jumlah karakter berbeda pada pola. Karakter teks yang tidak muncul di pola
+    selalu kembali ke root, sehingga tidak perlu kolom tersendiri.
+    """
+
+    def __init__(self, patterns: list[str]):
+        # Pola kosong tidak bermakna dan pola duplikat cukup dicari sekali
+        self.patterns = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+
+        goto, output = build_trie(self.patterns)
+        failure = build_failure_links(goto, output)
+
+        chars = sorted({char for pattern in self.patterns for char in pattern})
+        self.alphabet = {char: column for column, char in enumerate(chars)}
+        self.sigma = len(chars)
+        self.state_count = len(goto)
+
+        self.delta = build_dfa(goto, failure, self.alphabet, self.sigma)
+
+        # Output tiap state sebagai tuple (pola, panjang - 1) agar indeks awal langsung dihitung
+        self.outputs = [tuple((pattern, len(pattern) - 1) for pattern in patterns_at_state) for patterns_at_state in output]
+        self._encoded = None  # DFA untuk teks bytes, dibuat saat count_encoded pertama kali dipanggil
+
+    def _encoded_dfa(self) -> tuple[ReducedAlphabet, list[int], list[tuple[str, ...]]]:
+        if self._encoded is None:
+            # Trie yang sama dibangun ulang per byte; setiap state menyimpan pola str aslinya
+            encoded_patterns = {encode_text(pattern): pattern for pattern in self.patterns}
+            goto, output = build_trie(list(encoded_patterns))
+            failure = build_failure_links(goto, output)
+            alphabet = ReducedAlphabet(encoded_patterns)
+            columns = {byte: alphabet.column(byte) for byte in range(256) if alphabet.column(byte)}
+            delta = build_dfa(goto, failure, columns, alphabet.size)
+            outputs = [tuple(encoded_patterns[pattern] for pattern in patterns_at_state) for patterns_at_state in output]
+            # Transisi disimpan langsung sebagai offset baris tujuan (state * lebar), negatif jika
+            # state tujuan punya output. List, bukan array, agar lookup tidak membuat objek int baru.
+            width = alphabet.size
+            table = [-(state * width) if outputs[state] else state * width for state in delta]
+            self._encoded = (alphabet, table, outputs)
+        return self._encoded
+
+    def scan(self, text: str, limit: int | None = None) -> dict[str, list[int]]:
+        """
+        Mencari semua kemunculan pola dalam teks.
+        Jika limit diisi, hanya limit indeks pertama yang disimpan untuk setiap pola.
+
+        Returns:
+            dict[str, list[int]]: key adalah pola, value adalah daftar indeks awal kemunculannya.
+        """
+        matches = {pattern: [] for pattern in self.patterns}
+        if not self.patterns or not text or limit == 0:
+            return matches
+
+        delta = self.delta
+        alphabet = self.alphabet
+        sigma = self.sigma
+        outputs = self.outputs
+        state = 0
+
+        for i, char in enumerate(text):
+            column = alphabet.get(char)
+            if column is None:
+                state = 0
+                continue
+            state = delta[state * sigma + column]
+
+            # Jika ada output di state ini, berarti ada pola yang cocok
+            if outputs[state]:
+                for pattern, offset in outputs[state]:
+                    positions = matches[pattern]
+                    if limit is None or len(positions) < limit:
+                        positions.append(i - offset)
+
+        return matches
+
+    def count(self, text: str) -> dict[str, int]:
+        """
+        Menghitung jumlah kemunculan setiap pola tanpa menyimpan indeksnya.
+        Selama scan hanya dicatat berapa kali setiap state dikunjungi; jumlah per pola
+        dihitung sekali di akhir dari output state tersebut.
+        """
+        counts = dict.fromkeys(self.patterns, 0)
+        if not self.patterns or not text:
+            return counts
+
+        delta = self.delta
+        alphabet = self.alphabet
+        sigma = self.sigma
+        outputs = self.outputs
+        hits = [0] * self.state_count
+        state = 0
+
+        for char in text:
+            column = alphabet.get(char)
+            if column is None:
+                state = 0
+                continue
+            state = delta[state * sigma + column]
+            if outputs[state]:
+                hits[state] += 1
+
+        for state, hit_count in enumerate(hits):
+            if hit_count:
+                for pattern, _ in outputs[state]:
+                    counts[pattern] += hit_count
+        return counts
+
+    def count_encoded(self, data: bytes | memoryview) -> dict[str, int]:
+        """
+        Seperti count, tetapi untuk teks yang sudah di-encode (lib.encoding). Teks
+        diterjemahkan ke kolom alfabet pola, sehingga setiap byte hanya butuh satu
+        lookup di tabel DFA tanpa dictionary dan tanpa cabang untuk byte di luar pola.
+        """
+        counts = dict.fromkeys(self.patterns, 0)
+        if not self.patterns or not data:
+            return counts
+
+        alphabet, table, outputs = self._encoded_dfa()
+        width = alphabet.size
+        hits = [0] * len(outputs)
+        offset = 0
+        for columns in alphabet.translate_chunks(data):
+            for column in columns:
+                offset = table[offset + column]
+                if offset < 0:
+                    offset = -offset
+                    hits[offset // width] += 1
+
+        for state, hit_count in enumerate(hits):
+            if hit_count:
+                for pattern in outputs[state]:
+                    counts[pattern] += hit_count
+        return counts
+
 def aho_corasick(text: str, patterns: list[str]) -> dict[str, list[int]]:
     """
     Algoritma Aho-Corasick untuk mencari semua kemunculan dari beberapa pola
@@ -80,27 +249,9 @@ def aho_corasick(text: str, patterns: list[str]) -> dict[str, list[int]]:
     """
     if not patterns or not text:
         return {}
-        
-    goto, output = build_trie(patterns)
-    failure = build_failure_links(goto, output)
-    
-    matches = {pattern: [] for pattern in patterns}
-    state = 0
 
-    for i, char in enumerate(text):
-        while char not in goto[state] and state != 0:
-            state = failure[state]
-        
-        state = goto[state].get(char, 0)
-
-        # Jika ada output di state ini, berarti ada pola yang cocok
-        if output[state]:
-            for pattern in output[state]:
-                # Posisi akhir adalah i, posisi awal adalah i - len(pattern) + 1
-                start_index = i - len(pattern) + 1
-                matches[pattern].append(start_index)
-                
-    return matches
+    # Untuk banyak teks dengan pola yang sama, bangun AhoCorasick sekali lalu panggil scan()
+    return AhoCorasick(patterns).scan(text)
 
 
 if __name__ == "__main__":
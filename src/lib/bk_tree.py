@@ -0,0 +1,82 @@
+from typing import Callable
+from lib.levenshtein import levenshtein_distance, levenshtein_within
+
+class BKTree:
+    """
+    Burkhard-Keller tree untuk mencari kata-kata yang mirip dengan sebuah kata.
+
+    Setiap node menyimpan satu kata, dan anak-anaknya dikelompokkan berdasarkan
+    jarak Levenshtein ke kata tersebut. Karena jarak Levenshtein memenuhi
+    ketidaksamaan segitiga, pencarian dengan radius r dari node berjarak d cukup
+    menelusuri anak dengan jarak di rentang [d - r, d + r], sehingga sebagian
+    besar kosakata tidak perlu dibandingkan sama sekali.
+    """
+
+    def __init__(self, words: list[str] = (), distance: Callable[[str, str], int] = levenshtein_distance):
+        self.distance = distance
+        self.root = None  # Node: [kata, {jarak: node anak}]
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+
+        node = self.root
+        while True:
+            d = self.distance(word, node[0])
+            if d == 0:
+                return  # Kata sudah ada di tree
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Mengembalikan semua kata di tree dengan jarak <= max_distance dari word,
+        dalam bentuk list of (kata, jarak).
+        """
+        result = []
+        if self.root is None:
+            return result
+
+        # Untuk jarak bawaan, cukup hitung jarak sampai batas yang masih bisa berguna:
+        # jika d > max_distance + jarak anak terbesar, node ini dan semua anaknya pasti tidak cocok
+        bounded = self.distance is levenshtein_distance
+
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            if bounded:
+                d = levenshtein_within(word, node_word, max_distance + max(children, default=0))
+                if d is None:
+                    continue
+            else:
+                d = self.distance(word, node_word)
+            if d <= max_distance:
+                result.append((node_word, d))
+            for child_distance, child in children.items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    stack.append(child)
+        return result
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getstate__(self):
+        # Fungsi jarak bawaan tidak perlu ikut di-pickle
+        state = self.__dict__.copy()
+        if state["distance"] is levenshtein_distance:
+            state["distance"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.distance is None:
+            self.distance = levenshtein_distance
@@ -1,3 +1,7 @@
+from itertools import islice
+from typing import Iterator
+from lib.encoding import ReducedAlphabet, encode_text
+
 def last_occurance(pattern: str) -> dict:
     """
     Membuat tabel 'bad character (last_occurance)' menggunakan dictionary untuk mendukung semua karakter (Unicode).
@@ -44,6 +48,368 @@ def BM(text: str, pattern: str) -> list[int]:
             
     return matches
 
+def good_suffix_table(pattern: str) -> list[int]:
+    """
+    Membuat tabel 'good suffix' (versi strong) untuk Boyer-Moore.
+    shift[j + 1] adalah pergeseran aman jika mismatch terjadi di indeks j setelah
+    pattern[j + 1:] cocok; shift[0] adalah pergeseran setelah seluruh pattern cocok.
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border_position = [0] * (m + 1)  # Awal border terpanjang dari suffix pattern[i:]
+
+    i = m
+    j = m + 1
+    border_position[i] = j
+    while i > 0:
+        # Suffix yang tidak bisa diperpanjang ke kiri menentukan pergeseran untuk mismatch di j - 1
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border_position[j]
+        i -= 1
+        j -= 1
+        border_position[i] = j
+
+    # Sisa posisi memakai border terpanjang dari seluruh pattern (prefix yang juga suffix)
+    j = border_position[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border_position[j]
+    return shift
+
+class BoyerMoore:
+    """
+    Boyer-Moore lengkap: pergeseran terbesar dari 'bad character rule' dan 'good suffix rule'.
+    Tabel dibuat sekali per keyword, lalu search(text) dapat dipanggil untuk setiap CV.
+    Berbeda dengan BM, setelah pattern cocok pergeseran diambil dari good suffix sehingga
+    teks yang berulang (misalnya "aaaa...") tidak membuat pencarian mundur ke pergeseran 1.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.bad_char_table = last_occurance(pattern)
+        self.good_suffix = good_suffix_table(pattern)
+
+        # Versi bytes (lib.encoding): tabel bad character padat untuk semua 256 nilai byte
+        self.encoded_pattern = encode_text(pattern)
+        self.encoded_bad_char = [-1] * 256
+        for i, byte in enumerate(self.encoded_pattern):
+            self.encoded_bad_char[byte] = i
+        self.encoded_good_suffix = good_suffix_table(self.encoded_pattern)
+
+    def search(self, text: str, limit: int | None = None) -> list[int]:
+        """Semua indeks kemunculan, atau hanya limit indeks pertama jika diisi."""
+        return list(islice(self._occurrences(text), limit))
+
+    def count(self, text: str) -> int:
+        """Jumlah kemunculan tanpa membuat list indeks."""
+        return sum(1 for _ in self._occurrences(text))
+
+    def count_encoded(self, data: bytes | memoryview) -> int:
+        """Jumlah kemunculan pada teks yang sudah di-encode (lib.encoding)."""
+        pattern = self.encoded_pattern
+        n = len(data)
+        m = len(pattern)
+        if m == 0 or n == 0 or m > n:
+            return 0
+
+        bad_char_table = self.encoded_bad_char
+        good_suffix = self.encoded_good_suffix
+        count = 0
+        shift = 0
+        while shift <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == data[shift + j]:
+                j -= 1
+
+            if j < 0:
+                count += 1
+                shift += good_suffix[0]
+            else:
+                bad_char_shift = j - bad_char_table[data[shift + j]]
+                good_suffix_shift = good_suffix[j + 1]
+                shift += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+        return count
+
+    def _occurrences(self, text: str) -> Iterator[int]:
+        pattern = self.pattern
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or n == 0 or m > n:
+            return
+
+        bad_char_table = self.bad_char_table
+        good_suffix = self.good_suffix
+        shift = 0
+        while shift <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[shift + j]:
+                j -= 1
+
+            if j < 0:
+                yield shift
+                shift += good_suffix[0]
+            else:
+                bad_char_shift = j - bad_char_table.get(text[shift + j], -1)
+                good_suffix_shift = good_suffix[j + 1]
+                shift += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+
+class Horspool:
+    """
+    Boyer-Moore-Horspool: hanya memakai karakter teks yang sejajar dengan akhir pattern
+    untuk menentukan pergeseran. Tabelnya lebih kecil dan loop-nya lebih sederhana dari
+    Boyer-Moore lengkap, sehingga sering lebih cepat untuk keyword pendek seperti di CV.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        m = len(pattern)
+        # Karakter terakhir tidak ikut, agar pergeseran selalu minimal 1
+        self.shift_table = {char: m - 1 - i for i, char in enumerate(pattern[:-1])}
+
+        # Versi bytes (lib.encoding): tabel pergeseran padat untuk semua 256 nilai byte
+        self.encoded_pattern = encode_text(pattern)
+        encoded_length = len(self.encoded_pattern)
+        self.encoded_shift_table = [encoded_length] * 256
+        for i, byte in enumerate(self.encoded_pattern[:-1]):
+            self.encoded_shift_table[byte] = encoded_length - 1 - i
+
+    def search(self, text: str, limit: int | None = None) -> list[int]:
+        """Semua indeks kemunculan, atau hanya limit indeks pertama jika diisi."""
+        return list(islice(self._occurrences(text), limit))
+
+    def count(self, text: str) -> int:
+        """Jumlah kemunculan tanpa membuat list indeks."""
+        return sum(1 for _ in self._occurrences(text))
+
+    def count_encoded(self, data: bytes | memoryview) -> int:
+        """Jumlah kemunculan pada teks yang sudah di-encode (lib.encoding)."""
+        pattern = self.encoded_pattern
+        n = len(data)
+        m = len(pattern)
+        if m == 0 or n == 0 or m > n:
+            return 0
+
+        shift_table = self.encoded_shift_table
+        last_byte = pattern[-1]
+        count = 0
+        shift = 0
+        while shift <= n - m:
+            byte = data[shift + m - 1]
+            if byte == last_byte and data[shift:shift + m] == pattern:
+                count += 1
+            shift += shift_table[byte]
+        return count
+
+    def _occurrences(self, text: str) -> Iterator[int]:
+        pattern = self.pattern
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or n == 0 or m > n:
+            return
+
+        shift_table = self.shift_table
+        last_char = pattern[-1]
+        shift = 0
+        while shift <= n - m:
+            char = text[shift + m - 1]
+            if char == last_char and text[shift:shift + m] == pattern:
+                yield shift
+            shift += shift_table.get(char, m)
+
+def commentz_walter_tables(patterns: list) -> tuple[list[dict], list, dict, list[int], list[int]]:
+    """
+    Membuat trie pola terbalik beserta tabel pergeseran Commentz-Walter. Pola boleh
+    berupa str maupun bytes, simbolnya menjadi key dari dictionary tabel.
+    """
+    wmin = min(map(len, patterns), default=0)
+
+    # Trie dari pola yang dibalik, node 0 adalah root
+    children: list[dict] = [{}]
+    output: list = [None]
+    depth = [0]
+    parent = [0]
+    char_table: dict = {}  # Kedalaman terkecil tempat karakter muncul di trie
+    for pattern in patterns:
+        node = 0
+        for char in reversed(pattern):
+            next_node = children[node].get(char)
+            if next_node is None:
+                next_node = len(children)
+                children[node][char] = next_node
+                children.append({})
+                output.append(None)
+                depth.append(depth[node] + 1)
+                parent.append(node)
+                if depth[next_node] < char_table.get(char, wmin + 1):
+                    char_table[char] = depth[next_node]
+            node = next_node
+        output[node] = pattern
+
+    # Failure link (suffix terpanjang yang juga ada di trie), dihitung secara BFS
+    order = [0]
+    failure = [0] * len(children)
+    for node in order:
+        for char, next_node in children[node].items():
+            order.append(next_node)
+            if node == 0:
+                continue
+            f = failure[node]
+            while f and char not in children[f]:
+                f = failure[f]
+            failure[next_node] = children[f].get(char, 0)
+
+    # shift1[v]: jarak ke kemunculan lain dari string node v di dalam pola;
+    # shift2[v]: jarak agar suffix pola utuh sejajar dengan bagian yang sudah cocok
+    shift1 = [wmin] * len(children)
+    terminal_shift = [wmin] * len(children)
+    for node in order[1:]:
+        f = failure[node]
+        while True:
+            distance = depth[node] - depth[f]
+            if distance < shift1[f]:
+                shift1[f] = distance
+            if output[node] is not None and distance < terminal_shift[f]:
+                terminal_shift[f] = distance
+            if f == 0:
+                break
+            f = failure[f]
+    shift2 = [wmin] * len(children)
+    for node in order[1:]:
+        shift2[node] = min(shift2[parent[node]], terminal_shift[node])
+    return children, output, char_table, shift1, shift2
+
+class CommentzWalter:
+    """
+    Commentz-Walter: Boyer-Moore untuk banyak pola sekaligus, teks cukup di-scan sekali.
+    Pola dibalik lalu disimpan dalam satu trie; setiap posisi jendela dibaca mundur dari
+    kanan mengikuti trie, sehingga semua pola yang berakhir di posisi itu dicek bersamaan.
+    Pergeseran memakai gabungan 'bad character rule' (tabel char) dan 'good suffix rule'
+    (shift1/shift2) per node trie. Semua tabel dibuat sekali per kumpulan keyword.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        self.min_length = min(map(len, self.patterns), default=0)
+        self.children, self.output, self.char_table, self.shift1, self.shift2 = commentz_walter_tables(self.patterns)
+        self._encoded = None  # Tabel padat untuk teks bytes, dibuat saat count_encoded pertama kali dipanggil
+
+    def scan(self, text: str, limit: int | None = None) -> dict[str, list[int]]:
+        """
+        Mengembalikan {pola: daftar indeks awal kemunculan} untuk setiap pola.
+        Jika limit diisi, hanya limit indeks pertama yang disimpan untuk setiap pola.
+        """
+        matches = {pattern: [] for pattern in self.patterns}
+        if limit == 0:
+            return matches
+        output = self.output
+        for node, start in self._occurrences(text):
+            positions = matches[output[node]]
+            if limit is None or len(positions) < limit:
+                positions.append(start)
+        return matches
+
+    def count(self, text: str) -> dict[str, int]:
+        """Mengembalikan {pola: jumlah kemunculan} tanpa membuat list indeks."""
+        hits = [0] * len(self.children)
+        for node, _ in self._occurrences(text):
+            hits[node] += 1
+        counts = dict.fromkeys(self.patterns, 0)
+        for node, hit_count in enumerate(hits):
+            if hit_count:
+                counts[self.output[node]] = hit_count
+        return counts
+
+    def _encoded_tables(self) -> tuple:
+        if self._encoded is None:
+            encoded_patterns = {encode_text(pattern): pattern for pattern in self.patterns}
+            children, output, char_table, shift1, shift2 = commentz_walter_tables(list(encoded_patterns))
+            alphabet = ReducedAlphabet(encoded_patterns)
+            width = alphabet.size
+            wmin = min(map(len, encoded_patterns))
+            # Anak node disimpan dalam tabel padat node * width + kolom, 0 berarti tidak ada anak
+            dense_children = [0] * (len(children) * width)
+            for node, transitions in enumerate(children):
+                for byte, child in transitions.items():
+                    dense_children[node * width + alphabet.column(byte)] = child
+            dense_char = [wmin + 1] * width
+            for byte, depth in char_table.items():
+                dense_char[alphabet.column(byte)] = depth
+            output = [encoded_patterns[pattern] if pattern is not None else None for pattern in output]
+            self._encoded = (alphabet, wmin, dense_children, output, dense_char, shift1, shift2)
+        return self._encoded
+
+    def count_encoded(self, data: bytes | memoryview) -> dict[str, int]:
+        """Seperti count, untuk teks yang sudah di-encode (lib.encoding) dengan tabel padat."""
+        counts = dict.fromkeys(self.patterns, 0)
+        if not self.patterns:
+            return counts
+        alphabet, wmin, children, output, char_table, shift1, shift2 = self._encoded_tables()
+        n = len(data)
+        if n < wmin:
+            return counts
+
+        text = alphabet.translate(data)
+        width = alphabet.size
+        default_char = wmin + 1
+        hits = [0] * len(output)
+        pos = wmin - 1
+        while pos < n:
+            node = 0
+            j = 0
+            while j <= pos:
+                next_node = children[node * width + text[pos - j]]
+                if not next_node:
+                    break
+                node = next_node
+                j += 1
+                if output[node] is not None:
+                    hits[node] += 1
+
+            bad_char_shift = (char_table[text[pos - j]] if j <= pos else default_char) - j - 1
+            good_suffix_shift = shift1[node]
+            shift = bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+            pos += shift if shift < shift2[node] else shift2[node]
+
+        for node, hit_count in enumerate(hits):
+            if hit_count:
+                counts[output[node]] = hit_count
+        return counts
+
+    def _occurrences(self, text: str) -> Iterator[tuple[int, int]]:
+        # Menghasilkan (node akhir pola, indeks awal) untuk setiap kemunculan
+        n = len(text)
+        wmin = self.min_length
+        if not self.patterns or n < wmin:
+            return
+
+        children = self.children
+        output = self.output
+        char_table = self.char_table
+        shift1 = self.shift1
+        shift2 = self.shift2
+        default_char = wmin + 1
+        pos = wmin - 1  # Indeks akhir jendela
+        while pos < n:
+            node = 0
+            j = 0
+            while j <= pos:
+                next_node = children[node].get(text[pos - j])
+                if next_node is None:
+                    break
+                node = next_node
+                j += 1
+                if output[node] is not None:
+                    yield node, pos - j + 1
+
+            bad_char_shift = (char_table.get(text[pos - j], default_char) if j <= pos else default_char) - j - 1
+            good_suffix_shift = shift1[node]
+            shift = bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+            pos += shift if shift < shift2[node] else shift2[node]
+
 if __name__ == "__main__":
     text = "BILAKATADARIKATAMANAKATAKATA"
     pattern = "KATA"
@@ -58,4 +424,10 @@ if __name__ == "__main__":
     text3 = "TRUSTHARDTOOTHBRUSHES"
     pattern3 = "TOOTH"
     matches3 = BM(text3, pattern3)
-    print(f"Pattern '{pattern3}' found in '{text3}' at indices: {matches3}")
\ No newline at end of file
+    print(f"Pattern '{pattern3}' found in '{text3}' at indices: {matches3}")
+
+    for matcher in (BoyerMoore(pattern3), Horspool(pattern3)):
+        print(f"{type(matcher).__name__} '{pattern3}' found at indices: {matcher.search(text3)}")
+
+    patterns4 = ["TOOTH", "BRUSH", "HARD", "RUST"]
+    print(f"CommentzWalter {patterns4} found at indices: {CommentzWalter(patterns4).scan(text3)}")
@@ -0,0 +1,55 @@
+"""
+Representasi teks CV sebagai bytes UTF-8 untuk string matching.
+
+Teks CV sebagian besar ASCII, sehingga bytes UTF-8 memakai sekitar 1 byte per karakter,
+sedangkan str Python langsung memakai 2 atau 4 byte per karakter begitu ada satu karakter
+seperti '•' atau '–'. UTF-8 juga self-synchronizing: byte pertama sebuah karakter tidak
+pernah sama dengan byte lanjutan, sehingga pola muncul di teks str tepat sebanyak
+encoding pola muncul di encoding teks. Jumlah kemunculan dapat dihitung langsung pada bytes.
+"""
+from typing import Iterable, Iterator
+
+ENCODING = "utf-8"
+ERRORS = "surrogatepass"  # Teks hasil ekstraksi PDF tetap bisa di-encode walau ada surrogate tunggal
+TRANSLATE_CHUNK_SIZE = 1 << 16  # Byte per potongan saat memoryview diterjemahkan
+
+def encode_text(text: str) -> bytes:
+    return text.encode(ENCODING, ERRORS)
+
+def decode_text(data: bytes | memoryview) -> str:
+    return str(data, ENCODING, ERRORS)
+
+class ReducedAlphabet:
+    """
+    Alfabet kecil yang hanya berisi byte yang muncul di pola. Setiap byte tersebut
+    mendapat kolom 1..size - 1, semua byte lain menjadi kolom 0. Teks diterjemahkan
+    dengan bytes.translate (di C), lalu tabel transisi cukup selebar size, bukan 256,
+    dan tidak perlu pengecekan karakter yang tidak ada di tabel.
+    """
+
+    def __init__(self, patterns: Iterable[bytes]):
+        symbols = sorted({byte for pattern in patterns for byte in pattern})
+        table = bytearray(256)
+        for column, byte in enumerate(symbols, 1):
+            table[byte] = column
+        self.table = bytes(table)
+        self.size = len(symbols) + 1
+
+    def column(self, byte: int) -> int:
+        return self.table[byte]
+
+    def translate(self, data: bytes | memoryview) -> bytes:
+        """Kolom setiap byte data sekaligus, untuk matcher yang membaca teks secara acak."""
+        return (data if isinstance(data, bytes) else data.tobytes()).translate(self.table)
+
+    def translate_chunks(self, data: bytes | memoryview) -> Iterator[bytes]:
+        """
+        Kolom setiap byte data, berurutan per potongan, untuk matcher yang membaca teks dari
+        depan ke belakang. bytes.translate hanya menerima bytes, jadi memoryview dari corpus
+        store disalin dan diterjemahkan per potongan kecil, bukan seluruh teks sekaligus.
+        """
+        if isinstance(data, bytes):
+            yield data.translate(self.table)
+            return
+        for start in range(0, len(data), TRANSLATE_CHUNK_SIZE):
+            yield data[start:start + TRANSLATE_CHUNK_SIZE].tobytes().translate(self.table)
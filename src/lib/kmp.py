@@ -1,3 +1,5 @@
+from lib.encoding import ReducedAlphabet, encode_text
+
 def borderFunction(pattern: str) -> list[int]:
     # Returns the border function for the givern pattern.
     m = len(pattern)
@@ -47,6 +49,152 @@ def KMP(text: str, pattern: str) -> list[int]:
                 i += 1
     return matches
 
+class MultiKMP:
+    """ KMP for many patterns at once, scanning the text a single time.
+
+    The patterns are stored in a trie and the border function is generalized to it:
+    border[state] is the state of the longest proper suffix of that state's string that is
+    also a path in the trie. On a mismatch the scan falls back along the borders exactly like
+    KMP does with j = border[j - 1], so every text character is handled once for all patterns.
+    Built once per keyword set and reused for every CV.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        self.goto, self.border, self.outputs = buildTrie(self.patterns)
+        self._encoded = None  # Dense tables for encoded text, built on the first count_encoded
+
+    def scan(self, text: str, limit: int | None = None) -> dict[str, list[int]]:
+        """Returns {pattern: list of starting indices} for every pattern, at most limit per pattern if given."""
+        matches = {pattern: [] for pattern in self.patterns}
+        if not self.patterns or not text or limit == 0:
+            return matches
+
+        goto = self.goto
+        border = self.border
+        outputs = self.outputs
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = border[state]
+            state = goto[state].get(char, 0)
+            for pattern in outputs[state]:
+                positions = matches[pattern]
+                if limit is None or len(positions) < limit:
+                    positions.append(i - len(pattern) + 1)
+        return matches
+
+    def count(self, text: str) -> dict[str, int]:
+        """Returns {pattern: number of occurrences} without building the position lists."""
+        counts = dict.fromkeys(self.patterns, 0)
+        if not self.patterns or not text:
+            return counts
+
+        goto = self.goto
+        border = self.border
+        outputs = self.outputs
+        hits = [0] * len(goto)  # Visits of each state, spread over its patterns at the end
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = border[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                hits[state] += 1
+
+        for state, hit_count in enumerate(hits):
+            if hit_count:
+                for pattern in outputs[state]:
+                    counts[pattern] += hit_count
+        return counts
+
+    def _encoded_tables(self) -> tuple[ReducedAlphabet, list[int], list[int], list[tuple[str, ...]]]:
+        if self._encoded is None:
+            encoded_patterns = {encode_text(pattern): pattern for pattern in self.patterns}
+            goto, border, outputs = buildTrie(list(encoded_patterns))
+            alphabet = ReducedAlphabet(encoded_patterns)
+            width = alphabet.size
+            # dense[state * width + column] is the next state, -1 means fall back along the border.
+            # Column 0 (a byte in no pattern) always goes back to the root, the root never falls back.
+            dense = [-1] * (len(goto) * width)
+            for state, transitions in enumerate(goto):
+                base = state * width
+                dense[base] = 0
+                if state == 0:
+                    dense[1:width] = [0] * (width - 1)
+                for byte, next_state in transitions.items():
+                    dense[base + alphabet.column(byte)] = next_state
+            outputs = [tuple(encoded_patterns[pattern] for pattern in patterns_at_state) for patterns_at_state in outputs]
+            self._encoded = (alphabet, dense, border, outputs)
+        return self._encoded
+
+    def count_encoded(self, data: bytes | memoryview) -> dict[str, int]:
+        """Like count, for text encoded with lib.encoding, using array lookups instead of dicts."""
+        counts = dict.fromkeys(self.patterns, 0)
+        if not self.patterns or not data:
+            return counts
+
+        alphabet, goto, border, outputs = self._encoded_tables()
+        width = alphabet.size
+        hits = [0] * len(outputs)
+        state = 0
+        for columns in alphabet.translate_chunks(data):
+            for column in columns:
+                next_state = goto[state * width + column]
+                while next_state < 0:
+                    state = border[state]
+                    next_state = goto[state * width + column]
+                state = next_state
+                if outputs[state]:
+                    hits[state] += 1
+
+        for state, hit_count in enumerate(hits):
+            if hit_count:
+                for pattern in outputs[state]:
+                    counts[pattern] += hit_count
+        return counts
+
+def buildTrie(patterns: list) -> tuple[list[dict], list[int], list[tuple]]:
+    # Returns the trie (goto[state] = {symbol: next state}, state 0 is the empty string),
+    # its border function and the patterns ending at each state, including those that end
+    # at one of its borders. Patterns can be str or bytes.
+    goto: list[dict] = [{}]
+    ends_at: list = [None]
+    for pattern in patterns:
+        state = 0
+        for symbol in pattern:
+            next_state = goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][symbol] = next_state
+                goto.append({})
+                ends_at.append(None)
+            state = next_state
+        ends_at[state] = pattern
+
+    border = trieBorderFunction(goto)
+
+    outputs: list[tuple] = [()] * len(goto)
+    order = [0]
+    for state in order:
+        order.extend(goto[state].values())
+        inherited = outputs[border[state]] if state else ()
+        outputs[state] = ((ends_at[state],) if ends_at[state] is not None else ()) + inherited
+    return goto, border, outputs
+
+def trieBorderFunction(goto: list[dict[str, int]]) -> list[int]:
+    # Returns the border of every trie state, computed level by level like borderFunction.
+    border = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for char, next_state in goto[state].items():
+            j = border[state]
+            while j and char not in goto[j]:
+                j = border[j]
+            border[next_state] = goto[j].get(char, 0)
+            queue.append(next_state)
+    return border
+
 
 if __name__ == "__main__":
     text = "BILAKATADARIKATAMANAKATAKATA"
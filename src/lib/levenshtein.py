@@ -1,3 +1,11 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BATCH_MIN_WORDS = 16  # Di bawah ini overhead numpy lebih mahal dari DP Python biasa
+
 def levenshtein_distance(s1: str, s2: str) -> int:
     """
     Menghitung Levenshtein Distance antara dua string.
@@ -8,26 +16,152 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     """
     m, n = len(s1), len(s2)
 
-    # Inisialisasi matriks DP (Dynamic Programming)
-    # dp[i][j] akan menjadi jarak antara i karakter pertama s1
-    # dan j karakter pertama s2.
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-    # Inisialisasi baris dan kolom pertama
+    # DP (Dynamic Programming) baris per baris: previous[j] adalah jarak antara
+    # i - 1 karakter pertama s1 dan j karakter pertama s2, current untuk i karakter.
+    # Hanya dua baris yang dibutuhkan, bukan seluruh matriks (m+1) x (n+1).
     # Jarak dari string kosong ke string lain adalah panjang string itu sendiri
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
+    previous = list(range(n + 1))
+    current = [0] * (n + 1)
 
-    # Mengisi matriks DP
     for i in range(1, m + 1):
+        current[0] = i
         for j in range(1, n + 1):
             cost = 0 if s1[i - 1] == s2[j - 1] else 1  # Biaya substitusi
-            dp[i][j] = min(dp[i - 1][j] + 1,        # Deletion
-                           dp[i][j - 1] + 1,        # Insertion
-                           dp[i - 1][j - 1] + cost) # Substitution
-    return dp[m][n]
+            current[j] = min(previous[j] + 1,        # Deletion
+                             current[j - 1] + 1,     # Insertion
+                             previous[j - 1] + cost) # Substitution
+        previous, current = current, previous
+    return previous[n]
+
+def levenshtein_within(s1: str, s2: str, max_dist: int) -> int | None:
+    """
+    Levenshtein Distance yang dibatasi: mengembalikan jaraknya jika <= max_dist,
+    atau None jika lebih dari max_dist.
+
+    Sel (i, j) dengan |i - j| > max_dist pasti berjarak lebih dari max_dist, sehingga
+    hanya pita (band) selebar 2 * max_dist + 1 di sekitar diagonal yang dihitung
+    (Ukkonen). Perhitungan juga berhenti lebih awal begitu nilai minimum satu baris
+    sudah melebihi max_dist, karena nilai pada baris berikutnya tidak mungkin lebih kecil.
+    """
+    m, n = len(s1), len(s2)
+    if max_dist < 0 or abs(m - n) > max_dist:
+        return None
+    if m == 0 or n == 0:
+        return max(m, n)
+
+    # Semua nilai di atas max_dist disimpan sebagai too_far agar tidak perlu dibedakan lagi
+    too_far = max_dist + 1
+    previous = [j if j <= max_dist else too_far for j in range(n + 1)]
+    current = [too_far] * (n + 1)
+
+    for i in range(1, m + 1):
+        low = max(1, i - max_dist)
+        high = min(n, i + max_dist)
+        # Sel di kiri pita: kolom 0 (jarak i) atau di luar pita
+        current[low - 1] = i if i <= max_dist else too_far
+        row_min = current[low - 1]
+        char1 = s1[i - 1]
+
+        for j in range(low, high + 1):
+            if char1 == s2[j - 1]:
+                value = previous[j - 1]
+            else:
+                value = min(previous[j - 1], previous[j], current[j - 1]) + 1
+                if value > too_far:
+                    value = too_far
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        if row_min > max_dist:
+            return None
+        # Sel di kanan pita dibaca oleh baris berikutnya sebagai previous[j]
+        if high < n:
+            current[high + 1] = too_far
+        previous, current = current, previous
+
+    return previous[n] if previous[n] <= max_dist else None
+
+def max_distance_for_similarity(length: int, threshold: float) -> int:
+    """
+    Jarak terbesar yang masih mungkin memberi similarity (1 - jarak / panjang terpanjang)
+    minimal threshold persen terhadap string sepanjang length. String lain bisa lebih
+    panjang paling banyak sebesar jaraknya, sehingga jarak <= (1 - t) * (length + jarak)
+    dengan t = threshold / 100.
+    """
+    # Epsilon kecil menjaga pembulatan float agar batasnya tidak mengecil
+    return int((100 - threshold) * length / threshold + 1e-9)
+
+def similarity(distance: int, length1: int, length2: int) -> float:
+    """Similarity dalam persen: 1 - jarak / panjang string terpanjang."""
+    return (1 - (distance / max(length1, length2))) * 100
+
+def levenshtein_batch(s1: str, words: list[str]) -> "np.ndarray":
+    """
+    Levenshtein Distance dari s1 ke setiap kata sekaligus (membutuhkan numpy).
+
+    Kata dikelompokkan per panjang sehingga setiap kelompok menjadi matriks kode karakter
+    (jumlah kata x panjang) tanpa padding. DP tetap baris per baris untuk setiap karakter
+    s1, tetapi satu baris dihitung untuk semua kata dan semua kolom dengan operasi vektor:
+    deletion dan substitusi langsung dari baris sebelumnya, sedangkan insertion
+    (current[j - 1] + 1) berupa prefix minimum: current[j] = j + min(t[k] - k) untuk k <= j.
+    """
+    distances = np.empty(len(words), dtype=np.int32)
+    m = len(s1)
+    keyword = np.frombuffer(s1.encode("utf-32-le"), dtype=np.uint32)
+
+    by_length: dict[int, list[int]] = {}
+    for index, word in enumerate(words):
+        by_length.setdefault(len(word), []).append(index)
+
+    for n, indices in by_length.items():
+        if m == 0 or n == 0:
+            distances[indices] = max(m, n)
+            continue
+        chars = np.frombuffer("".join(words[i] for i in indices).encode("utf-32-le"), dtype=np.uint32).reshape(len(indices), n)
+        columns = np.arange(1, n + 1, dtype=np.int32)
+        previous = np.tile(np.arange(n + 1, dtype=np.int32), (len(indices), 1))
+        current = np.empty_like(previous)
+        for i in range(1, m + 1):
+            cost = (chars != keyword[i - 1]).astype(np.int32)
+            # Deletion dan substitusi, lalu insertion sebagai prefix minimum sepanjang baris
+            t = np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost)
+            np.minimum.accumulate(t - columns, axis=1, out=t)
+            current[:, 0] = i
+            np.minimum(t + columns, i + columns, out=current[:, 1:])
+            previous, current = current, previous
+        distances[indices] = previous[:, n]
+    return distances
+
+def similarity_batch(s1: str, words: list[str]) -> "np.ndarray":
+    """Similarity (persen) s1 terhadap setiap kata sebagai vektor numpy, lihat similarity()."""
+    distances = levenshtein_batch(s1, words)
+    longest = np.maximum(len(s1), np.fromiter((len(word) for word in words), dtype=np.int32, count=len(words)))
+    return (1 - (distances / longest)) * 100
+
+def count_similar(keyword: str, words: list[str], threshold: float) -> int:
+    """
+    Jumlah kata yang similarity-nya terhadap keyword minimal threshold persen tetapi di
+    bawah 100 (kata yang identik adalah exact match). Kata yang panjangnya terlalu jauh
+    dibuang lebih dulu; sisanya dinilai sekaligus dengan numpy jika tersedia, jika tidak
+    satu per satu dengan levenshtein_within.
+    """
+    max_distance = max_distance_for_similarity(len(keyword), threshold)
+    candidates = [word for word in words if abs(len(word) - len(keyword)) <= max_distance]
+    if not candidates:
+        return 0
+
+    if NUMPY_AVAILABLE and len(candidates) >= BATCH_MIN_WORDS:
+        scores = similarity_batch(keyword, candidates)
+        return int(np.count_nonzero((scores >= threshold) & (scores < 100)))
+
+    count = 0
+    for word in candidates:
+        # Sebagian besar kata sudah ditolak setelah beberapa baris DP berpita
+        distance = levenshtein_within(keyword, word, max_distance)
+        if distance is not None and threshold <= similarity(distance, len(keyword), len(word)) < 100:
+            count += 1
+    return count
 
 if __name__ == "__main__":
     # Contoh 1: kitten -> sitting (3 operasi)
@@ -1,6 +1,6 @@
-import fitz
 import re
-from models.search import WorkExperienceEntry, EducationEntry
+from functools import lru_cache
+from models.search import WorkExperienceEntry, EducationEntry, CVSummaryExtraction
 
 keywordsRandomSection = [
     "Accomplishment",
@@ -67,6 +67,7 @@ keywordsSection = keywordsRandomSection + keywordsSumSection + keywordsJobSectio
 
 # Ekstraksi seluruh teks pada file .pdf, mengembalikan dalam bentuk string
 def pdfToString(filepath):
+    import fitz  # Diimpor saat pertama dipakai agar startup aplikasi tidak menunggu PyMuPDF
     pdf = fitz.open(filepath)
     text = ""
     for page in pdf:
@@ -80,126 +81,118 @@ def createRegex(keywords):
     result = f"^(?:{escapeKeywords})$"
     return result
 
+# Regex judul section yang sudah dikompilasi, satu kali untuk setiap tuple keywords yang berbeda
+@lru_cache(maxsize=64)
+def compileRegex(keywords):
+    return re.compile(createRegex(keywords))
+
+# Registry pola judul section untuk extractSections, di-cache per kombinasi keywords.
+# Mengembalikan (regex gabungan semua judul, judul -> kategori yang dimulai olehnya),
+# dengan kategori "end" jika judul tersebut mengakhiri section yang sedang aktif
+@lru_cache(maxsize=64)
+def compileSectionHeaders(keywordsSummary, keywordsJob, keywordsEdu, keywordsSkill, keywordsSection):
+    categories = {
+        "summary": keywordsSummary,
+        "job": keywordsJob,
+        "edu": keywordsEdu,
+        "skill": keywordsSkill,
+    }
+    headerCategories = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            headerCategories.setdefault(keyword, set()).add(category)
+    for keyword in keywordsSection:
+        headerCategories.setdefault(keyword, set()).add("end")
+    headerCategories = {keyword: frozenset(category) for keyword, category in headerCategories.items()}
+    return compileRegex(tuple(headerCategories)), headerCategories
+
+# Judul baris pekerjaan atau baris yang mengandung tahun dianggap entri riwayat kerja
+patternTitle = re.compile(r'^(?:(?:\b[A-Z][a-zA-Z]*\b|\b(?:at|to|in|of|for)\b)|[\/,&â€“ï¼\-]|\s+)+$')
+patternYear = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+# Pola judul section bawaan langsung dikompilasi saat modul dimuat
+compileSectionHeaders(tuple(keywordsSumSection), tuple(keywordsJobSection), tuple(keywordsEduSection),
+                      tuple(keywordsSkillSection), tuple(keywordsSection))
+
+# Segmentasi semua section dalam satu kali baca, mengembalikan CVSummaryExtraction
+# Sebuah section dimulai pada judul section pertamanya dan berakhir pada judul section berikutnya
+def extractSections(text, keywordsSummary=keywordsSumSection, keywordsJob=keywordsJobSection,
+                    keywordsEdu=keywordsEduSection, keywordsSkill=keywordsSkillSection, keywordsSection=keywordsSection):
+    patternHeader, headerCategories = compileSectionHeaders(
+        tuple(keywordsSummary), tuple(keywordsJob), tuple(keywordsEdu), tuple(keywordsSkill), tuple(keywordsSection)
+    )
+    categories = ("summary", "job", "edu", "skill")
+    noCategory = frozenset()
+
+    contents = {category: None for category in categories}  # None: section belum ditemukan
+    active = set()
+
+    for line in text.split('\n'):
+        cleanedLine = line.strip().replace('\u200b', '')
+        header = patternHeader.match(cleanedLine) if cleanedLine else None
+        headerCategory = headerCategories[header.group(0)] if header else noCategory
+
+        if "end" in headerCategory:
+            active.clear()
+        else:
+            for category in active:
+                if category == "summary":
+                    contents[category].append(line)
+                elif cleanedLine:
+                    contents[category].append(cleanedLine)
+
+        # Hanya judul pertama tiap kategori yang memulai section
+        for category in headerCategory - {"end"}:
+            if contents[category] is None:
+                contents[category] = []
+                active.add(category)
+
+    jobsAsEntry = []
+    for cleanedLine in contents["job"] or []:
+        if patternTitle.fullmatch(cleanedLine) or patternYear.search(cleanedLine):
+            jobsAsEntry.append(WorkExperienceEntry(
+                position=cleanedLine,
+                company="",
+                start_date="",
+                end_date="",
+                description=""
+            ))
+
+    edusAsEntry = []
+    for cleanedLine in contents["edu"] or []:
+        edusAsEntry.append(EducationEntry(
+            institution=cleanedLine,
+            program="",
+            start_date="",
+            end_date=""
+        ))
+
+    return CVSummaryExtraction(
+        description=" ".join(contents["summary"] or []),
+        skills=contents["skill"] or [],
+        education=edusAsEntry,
+        work_experience=jobsAsEntry
+    )
+
+# Ekstraksi seluruh section dari file .pdf dengan satu kali parsing
+def extractAll(pathfile, **keywords):
+    return extractSections(pdfToString(pathfile), **keywords)
+
 # Mengembalikan string panjang, "" jika tidak memiliki summary (ada sekitar 70/600 cv yang gapunya summary)
 def extractSummary(pathfile, keywordsSummary=keywordsSumSection, keywordsSection=keywordsSection):
-    text = pdfToString(pathfile)
-    patternSummary = re.compile(createRegex(keywordsSummary))
-    patternSection = re.compile(createRegex(keywordsSection))
-
-    startIdx = -1
-    endIdx = -1
-    inSection = False
-
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        if patternSummary.match(line) and not inSection:
-            startIdx = i + 1
-            inSection = True
-        elif patternSection.match(line) and inSection:
-            endIdx = i - 1
-            break
-    
-    result = " ".join(lines[startIdx:endIdx + 1])
-    return result
+    return extractAll(pathfile, keywordsSummary=keywordsSummary, keywordsSection=keywordsSection).description
 
 # Mengembalikan list[WorkExperienceEntry], harusnya tinggal di print setiap element dari listnya
 def extractJob(pathfile, keywordsJob=keywordsJobSection, keywordsSection=keywordsSection):
-    text = pdfToString(pathfile)
-    patternJob = re.compile(createRegex(keywordsJob))
-    patternSection = re.compile(createRegex(keywordsSection))
-    patternTitle = r'^(?:(?:\b[A-Z][a-zA-Z]*\b|\b(?:at|to|in|of|for)\b)|[\/,&â€“ï¼\-]|\s+)+$'
-    patterYear = r'\b(19\d{2}|20\d{2})\b'
-
-    jobs = []
-    jobsAsEntry = []
-    inSection = False
-
-    lines = text.split('\n')
-    for line in lines:
-        cleanedLine = line.strip().replace('\u200b', '')
-        if not cleanedLine:
-            continue
-
-        if inSection:
-            if patternSection.match(cleanedLine):
-                break
-
-            isTitle = re.fullmatch(patternTitle, cleanedLine)
-            containYear = re.search(patterYear, cleanedLine)
-
-            if isTitle or containYear:
-                jobs.append(cleanedLine)
-                entry = WorkExperienceEntry(
-                    position=cleanedLine,
-                    company="",
-                    start_date="",
-                    end_date="",
-                    description=""
-                )
-                jobsAsEntry.append(entry)
-        
-        elif patternJob.match(cleanedLine):
-            inSection = True
-            
-    return jobsAsEntry
+    return extractAll(pathfile, keywordsJob=keywordsJob, keywordsSection=keywordsSection).work_experience
 
 # Mengembalikan list[EducationEntry], harusnya tinggal di print setiap element dari listnya
 def extractEdu(pathfile, keywordsEdu=keywordsEduSection, keywordsSection=keywordsSection):
-    text = pdfToString(pathfile)
-    patternEdu = re.compile(createRegex(keywordsEdu))
-    patternSection = re.compile(createRegex(keywordsSection))
-
-    edus = []
-    edusAsEntry = []
-    inSection = False
-
-    lines = text.split('\n')
-    for line in lines:
-        cleanedLine = line.strip().replace('\u200b', '')
-        if not cleanedLine:
-            continue
-
-        if inSection:
-            if patternSection.match(cleanedLine):
-                break
-            edus.append(cleanedLine)
-            entry = EducationEntry(
-                institution=cleanedLine,
-                program="",
-                start_date="",
-                end_date=""
-            )
-            edusAsEntry.append(entry)
-        
-        elif patternEdu.match(cleanedLine):
-            inSection = True
-            
-    return edusAsEntry
+    return extractAll(pathfile, keywordsEdu=keywordsEdu, keywordsSection=keywordsSection).education
 
 # Mengembalikan list[str], harusnya tinggal di print setiap element dari listnya
 def extractSkill(pathfile, keywordsSkill=keywordsSkillSection, keywordsSection=keywordsSection):
-    text = pdfToString(pathfile)
-    patternSkill = re.compile(createRegex(keywordsSkill))
-    patternSection = re.compile(createRegex(keywordsSection))
-
-    skills = []
-    inSection = False
-
-    lines = text.split('\n')
-    for line in lines:
-        cleanedLine = line.strip().replace('\u200b', '')
-        if not cleanedLine:
-            continue
-
-        if inSection:
-            if patternSection.match(cleanedLine):
-                break
-            skills.append(cleanedLine)
-        
-        elif patternSkill.match(cleanedLine):
-            inSection = True
-
-    return skills
+    return extractAll(pathfile, keywordsSkill=keywordsSkill, keywordsSection=keywordsSection).skills
 
 
 # for i in range(1, 11):
@@ -1,30 +1,39 @@
+from util import startup_profile
 import sys
 import traceback
 import argparse
-from PyQt6.QtWidgets import QApplication
-from main_window import MainWindow
-from database.cv_database import CVDatabase
+from database.backends import BACKENDS
+from cli import ALGORITHMS
 
-def main():
+def main(workers=None, backend="mysql"):
     try:
         print("Hello from tubes3-hrdbawel!")
         print("Initializing QApplication...")
         
+        # Qt and the GUI modules are only imported when the GUI is started
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
         app = QApplication(sys.argv)
         print("QApplication created successfully")
+        startup_profile.mark("QApplication created")
         
         print("Creating MainWindow...")
         try:
-            window = MainWindow()
+            from main_window import MainWindow
+            startup_profile.mark("GUI modules imported")
+            window = MainWindow(workers, backend)
             print("MainWindow created successfully")
         except Exception as e:
             print(f"Error creating MainWindow: {e}")
             traceback.print_exc()
             return
         
+        startup_profile.mark("MainWindow created")
+        
         print("Showing window...")
         window.show()
         print("Window shown successfully")
+        QTimer.singleShot(0, lambda: startup_profile.mark("window shown"))
         
         print("Starting event loop...")
         sys.exit(app.exec())
@@ -39,21 +48,94 @@ def main():
     
     input("Press Enter to continue...")  # Pause untuk melihat error
 
+def add_common_arguments(parser, default=None):
+    parser.add_argument("--db",
+                        choices=BACKENDS,
+                        default=default or "mysql",
+                        help="Storage backend: a MySQL server on localhost (default) or a local SQLite file.")
+    parser.add_argument("--workers",
+                        type=int,
+                        default=default,
+                        metavar="N",
+                        help="Number of worker processes used to scan CVs (default: number of CPU cores).")
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="A tool to analyze and search through CVs.")
     parser.add_argument("--seed",
                         nargs='+',
                         metavar=('PATH', '[ROLE]'),
                         help="Populate the database with CVs from PATH, filled in with the specified ROLE.")
+    parser.add_argument("--seed-all",
+                        nargs='?',
+                        const="data",
+                        metavar="PATH",
+                        help="Populate the database with every CV below PATH (default: data), the role of each CV is the name of its folder.")
+    parser.add_argument("--sync",
+                        nargs='?',
+                        const="data",
+                        metavar="PATH",
+                        help="Incrementally sync the database with the CVs below PATH (default: data): only new, changed and deleted files are processed.")
+    parser.add_argument("--extract-summaries",
+                        action="store_true",
+                        help="Extract and store the summary of every CV that has none yet, then exit.")
+    parser.add_argument("--profile-startup",
+                        action="store_true",
+                        help="Print how long each startup phase took once the database is ready.")
+    add_common_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    search_parser = subparsers.add_parser("search", help="Search the CVs without the GUI and print the results.")
+    search_input = search_parser.add_mutually_exclusive_group(required=True)
+    search_input.add_argument("--keywords",
+                              nargs='+',
+                              help="Keywords to search for, as separate arguments and/or comma separated.")
+    search_input.add_argument("--batch",
+                              metavar="FILE",
+                              help="Run one search per line of FILE (comma separated keywords, - for stdin) in a single process.")
+    search_parser.add_argument("--algorithm",
+                               choices=tuple(ALGORITHMS),
+                               default="KMP",
+                               help="Exact matching algorithm: AC is Aho-Corasick, BM-GS is Boyer-Moore with the good suffix rule (default: KMP).")
+    search_parser.add_argument("--top",
+                               type=int,
+                               default=0,
+                               metavar="N",
+                               help="Only return the N best matching applicants (default: all).")
+    search_parser.add_argument("--json",
+                               action="store_true",
+                               help="Print one JSON object per search instead of a table.")
+    # Also accepted after the command, without overriding values given before it
+    add_common_arguments(search_parser, default=argparse.SUPPRESS)
 
     args = parser.parse_args()
-    if args.seed:
-        database = CVDatabase()
+    if args.profile_startup:
+        startup_profile.enable()
+        startup_profile.mark("arguments parsed")
+    if args.seed or args.seed_all or args.sync or args.extract_summaries:
+        from database.backends import open_database
+        from util.summary_extractor import extract_summaries
+
+    if args.command == "search":
+        from cli import run_search
+        sys.exit(run_search(args))
+    elif args.seed:
+        database = open_database(args.db)
         relative_path = args.seed[0].replace("/", "\\")
         role = args.seed[1] if len(args.seed) > 1 else None
         if role:
-            database.seed_database(relative_path, role)
+            database.seed_database(relative_path, role, workers=args.workers)
         else:
-            database.seed_database(relative_path)
+            database.seed_database(relative_path, workers=args.workers)
+        extract_summaries(database, workers=args.workers)
+    elif args.seed_all:
+        database = open_database(args.db)
+        database.seed_directory(args.seed_all, workers=args.workers)
+        extract_summaries(database, workers=args.workers)
+    elif args.sync:
+        database = open_database(args.db)
+        database.sync_directory(args.sync, workers=args.workers)
+        extract_summaries(database, workers=args.workers)
+    elif args.extract_summaries:
+        extract_summaries(open_database(args.db), workers=args.workers)
     else:
-        main()
\ No newline at end of file
+        main(args.workers, args.db)
\ No newline at end of file
@@ -1,30 +1,25 @@
 from PyQt6.QtWidgets import QMainWindow, QStackedWidget
 from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtCore import QUrl
-import time
+from PyQt6.QtCore import QUrl, QThread
+import multiprocessing
 import os
-import re
 from datetime import datetime
 from gui.search_page import SearchPage
 from gui.summary_page import SummaryPage
-from models.search import SearchParams, ApplicantMatchData, ApplicationDetail, SearchResult, SearchAlgorithm, WorkExperienceEntry, EducationEntry, CVSummary
-
-from lib.kmp import KMP
-from lib.bm import BM
-from lib.aho_corasick import aho_corasick
-from lib.levenshtein import levenshtein_distance
-from lib.regex import extractEdu, extractJob, extractSkill, extractSummary
-from database.cv_database import CVDatabase
-from util.parser import pdf_to_string
-
-algorithm_map = {
-    SearchAlgorithm.KMP: KMP,
-    SearchAlgorithm.BM: BM,
-    SearchAlgorithm.AHO_CORASICK: aho_corasick,
-}
+from gui.search_worker import SearchWorker
+from gui.startup_worker import StartupWorker
+from models.search import SearchParams, SearchResult, WorkExperienceEntry, EducationEntry, CVSummary
+
+from lib.regex import extractAll
+from engine.search_engine import SearchEngine
+from util.summary_extractor import extract_missing_summaries
+from util import startup_profile
+
+SUMMARY_WORKERS = max(1, (os.cpu_count() or 1) // 2)  # Leaves the other cores to the search pool
+SUMMARY_STOP_TIMEOUT = 10  # Seconds the summary process gets to finish its current CVs on close
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, workers: int | None = None, backend: str = "mysql"):
         super().__init__()
 
         self.setWindowTitle("Application Tracking System ")
@@ -33,14 +28,16 @@ class MainWindow(QMainWindow):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
-        # Initialize database with error handling
-        try:
-            print("Initializing database...")
-            self.db = CVDatabase()
-            print("Database initialized successfully")
-        except Exception as e:
-            print(f"Database initialization failed: {e}")
-            self.db = None
+        self.backend = backend
+        # Set once the StartupWorker has connected, searches wait for them in pending_search
+        self.db = None
+        self.engine: SearchEngine | None = None
+        self.search_thread: QThread | None = None
+        self.search_worker: SearchWorker | None = None
+        self.pending_search: SearchParams | None = None
+        self.summary_process: multiprocessing.Process | None = None
+        self.summary_stop = None  # Event that asks the summary process to stop
+        self.startup_error: str | None = None  # Set if the StartupWorker failed, nothing is queued then
 
         print("Creating search page...")
         self.search_page = SearchPage()
@@ -53,118 +50,111 @@ class MainWindow(QMainWindow):
         # Connect signals
         print("Connecting signals...")
         self.search_page.search_initiate.connect(self.search)
+        self.search_page.search_cancel.connect(self.cancel_search)
         self.search_page.view_summary.connect(self.summary)
         self.search_page.view_cv.connect(self.view_cv)
         self.summary_page.return_from_summary.connect(self.return_to_search)
 
+        # The database connection and the search index load behind the already visible window
+        print("Initializing database...")
+        self.startup_thread = QThread(self)
+        self.startup_worker = StartupWorker(backend, workers)
+        self.startup_worker.moveToThread(self.startup_thread)
+        self.startup_thread.started.connect(self.startup_worker.run)
+        self.startup_worker.status.connect(self.search_page.show_status)
+        self.startup_worker.ready.connect(self.on_startup_ready)
+        self.startup_worker.failed.connect(self.on_startup_failed)
+        self.startup_worker.done.connect(self.startup_thread.quit)
+        self.startup_thread.finished.connect(self.startup_worker.deleteLater)
+        self.startup_thread.finished.connect(startup_profile.report)
+        self.startup_thread.start()
+
     def show_search_page(self):
         """Method untuk kembali ke halaman search"""
         self.stack.setCurrentWidget(self.search_page)
 
 
-    def search(self, search_params: SearchParams):
-        search_results = SearchResult(applicants=[], cvs_scanned=0, runtime=0)
-        applications = self.db.get_all_application_details()
-
-        app_matches = self.exact_search(search_params, search_results, applications)
-
-        if not app_matches:
-            self.fuzzy_search(search_params, search_results, applications, app_matches)
+    def on_startup_ready(self, db, engine: SearchEngine):
+        self.db = db
+        self.engine = engine
+        print("Database initialized successfully")
+        self.search_page.show_status("Start by entering keywords in the left panel")
 
-        for detail_id, match_data in app_matches.items():
-            applicant_id = -1
-            for app in applications:
-                if app.detail_id == detail_id:
-                    applicant_id = app.applicant_id
-                    break
-            profile = self.db.get_applicant_profile(applicant_id)
-            if profile:
-                match_data.name = f"{profile.first_name} {profile.last_name}"
-                search_results.applicants.append(match_data)
+        # Summaries missing from the database are extracted while the user searches, in a separate
+        # process with its own connection and pool so PDF parsing does not hold this process's GIL
+        context = multiprocessing.get_context("spawn")
+        self.summary_stop = context.Event()
+        self.summary_process = context.Process(
+            target=extract_missing_summaries, args=(self.backend, SUMMARY_WORKERS, self.summary_stop), name="summary-extraction")
+        self.summary_process.start()
 
-        search_results.applicants.sort(key=lambda x: x.match_count, reverse=True)
+        if self.pending_search is not None:
+            self.start_search()
 
-        if search_params.top_matches > 0:
-            search_results.applicants = search_results.applicants[:search_params.top_matches]
+    def on_startup_failed(self, error: str):
+        print(f"Database initialization failed: {error}")
+        self.pending_search = None
+        self.startup_error = error
+        self.search_page.show_status(f"Database unavailable: {error}")
 
-        self.search_page.show_results(search_results)
-
-    def exact_search(self, search_params: SearchParams, search_results: SearchResult, applications: list[ApplicationDetail]) -> dict[int, ApplicantMatchData]:
-        print(f"Performing exact search with parameters: {search_params}")
-        
-        search_function = algorithm_map.get(search_params.algorithm)
-
-        final_results: dict[int, ApplicantMatchData] = {}
-        start_time = time.time()
-        for app in applications:
-            cv_text = pdf_to_string(app.cv_path).lower() if app.cv_path else ""
-            exact_matches: dict[str, int] = {}
-            if search_params.algorithm == SearchAlgorithm.AHO_CORASICK:
-                matches = aho_corasick(cv_text, search_params.keywords)
-                exact_matches = {k: len(v) for k, v in matches.items() if v}
-            else:
-                for keyword in search_params.keywords:
-                    keyword_lower = keyword.strip().lower()
-                    if not keyword_lower: continue
-
-                    occurrences = search_function(cv_text, keyword_lower)
-                    if occurrences:
-                        exact_matches[keyword] = len(occurrences)
-            
-            if exact_matches:
-                final_results[app.detail_id] = ApplicantMatchData(
-                    detail_id=app.detail_id,
-                    name="",  # Filled later
-                    match_count = sum(exact_matches.values()),
-                    matched_keywords=exact_matches,
-                )
-        end_time = time.time()
-        
-        search_results.cvs_scanned = len(applications)
-        search_results.runtime = (end_time - start_time) * 1000
-        return final_results
-
-    def fuzzy_search(self, search_params: SearchParams, search_results: SearchResult, applications: list[ApplicationDetail], previous_matches: dict[int, ApplicantMatchData]) -> None:
-        print(f"Performing fuzzy search with parameters: {search_params}")
-        SIMILARITY_THRESHOLD = 80.0
-
-        start_time = time.time()
-        for app in applications:
-            cv_text = pdf_to_string(app.cv_path).lower() if app.cv_path else ""
-            fuzzy_matches: dict[str, int] = {}
-            for keyword in search_params.keywords:
-                keyword_lower = keyword.strip().lower()
-                if not keyword_lower: continue
-                
-                words_in_cv = set(re.findall(r'[a-z]+', cv_text))
-                for word_in_cv in words_in_cv:
-                    len_max = max(len(keyword_lower), len(word_in_cv))
-                    if len_max > 0:
-                        distance = levenshtein_distance(keyword_lower, word_in_cv)
-                        similarity = (1 - (distance / len_max)) * 100
-                        if SIMILARITY_THRESHOLD <= similarity < 100:
-                            fuzzy_key = f"{keyword}"
-                            fuzzy_matches[fuzzy_key] = fuzzy_matches.get(fuzzy_key, 0) + 1
-            
-            if fuzzy_matches:
-                detail_id = app.detail_id
-                if detail_id in previous_matches:
-                    match_data = previous_matches[detail_id]
-                    match_data.match_count += sum(fuzzy_matches.values())
-                    match_data.fuzzy_matched_keywords = fuzzy_matches
-                else:
-                    match_data = ApplicantMatchData(
-                        detail_id=detail_id,
-                        name="",  # Filled later
-                        match_count=sum(fuzzy_matches.values()),
-                        matched_keywords={},
-                        fuzzy_matched_keywords=fuzzy_matches
-                    )
-                    previous_matches[detail_id] = match_data
-        end_time = time.time()
-
-        search_results.cvs_scanned = len(applications)
-        search_results.fuzzy_runtime = (end_time - start_time) * 1000
+    def search(self, search_params: SearchParams):
+        if self.engine is None and self.startup_error is not None:
+            # on_startup_ready will never come, a queued search would show "Searching..." forever
+            self.search_page.show_status(f"Database unavailable: {self.startup_error}")
+            return
+        self.pending_search = search_params
+        if self.engine is None:
+            # Starts from on_startup_ready
+            self.search_page.show_search_started()
+            return
+        if self.search_thread is not None:
+            # The running search stops at its next checkpoint, the new one starts once it is done
+            self.search_worker.cancel()
+            return
+        self.start_search()
+
+    def start_search(self):
+        search_params, self.pending_search = self.pending_search, None
+        self.search_page.show_search_started()
+
+        self.search_thread = QThread(self)
+        self.search_worker = SearchWorker(self.engine, search_params)
+        self.search_worker.moveToThread(self.search_thread)
+
+        self.search_thread.started.connect(self.search_worker.run)
+        self.search_worker.progress.connect(self.search_page.show_progress)
+        self.search_worker.partial_results.connect(self.show_partial_results)
+        self.search_worker.finished.connect(self.search_page.show_results)
+        self.search_worker.cancelled.connect(self.on_search_stopped)
+        self.search_worker.failed.connect(self.on_search_stopped)
+        self.search_worker.done.connect(self.search_thread.quit)
+        self.search_thread.finished.connect(self.search_worker.deleteLater)
+        self.search_thread.finished.connect(self.search_thread.deleteLater)
+        self.search_thread.finished.connect(self.on_search_thread_finished)
+
+        self.search_thread.start()
+
+    def cancel_search(self):
+        if self.engine is None and self.pending_search is not None:
+            self.search_page.clear_results()
+        self.pending_search = None
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+
+    def show_partial_results(self, search_results: SearchResult):
+        # An empty partial result would show "No applicant found" while still searching
+        if search_results.applicants:
+            self.search_page.show_results(search_results)
+
+    def on_search_stopped(self):
+        if self.pending_search is None:
+            self.search_page.clear_results()
+
+    def on_search_thread_finished(self):
+        self.search_thread = None
+        self.search_worker = None
+        if self.pending_search is not None:
+            self.start_search()
 
     def view_cv(self, detail_id: str):
         """
@@ -207,17 +197,41 @@ class MainWindow(QMainWindow):
             work_experience = []
         )
 
-        # TO DO: Dummy page. INTEGRATE NEXT
-        # Dummy data for testing
-        cv_summary.description = extractSummary(app_detail.cv_path)
-        cv_summary.skills = extractSkill(app_detail.cv_path)
-        cv_summary.education = extractEdu(app_detail.cv_path)
-        cv_summary.work_experience = extractJob(app_detail.cv_path)
+        # Pre-extracted summaries are a single lookup, otherwise parse the PDF once and store it
+        extraction = self.db.get_summary_extraction(detail_id)
+        if extraction is None:
+            extraction = extractAll(app_detail.cv_path)
+            self.db.save_summary_extractions({detail_id: extraction})
+        cv_summary.description = extraction.description
+        cv_summary.skills = extraction.skills
+        cv_summary.education = extraction.education
+        cv_summary.work_experience = extraction.work_experience
 
         self.summary_page.set_summary(detail_id, cv_summary)
         self.stack.setCurrentWidget(self.summary_page)
         # Extracted CV summary
 
+    def closeEvent(self, event):
+        self.pending_search = None
+        if self.search_thread is not None:
+            self.search_worker.cancel()
+            self.search_thread.wait()
+        self.startup_worker.cancel()
+        self.startup_thread.quit()
+        self.startup_thread.wait()
+        if self.summary_process is not None:
+            # Summaries stored so far are kept, the rest are extracted next time
+            self.summary_stop.set()
+            self.summary_process.join(SUMMARY_STOP_TIMEOUT)
+            if self.summary_process.is_alive():
+                self.summary_process.terminate()
+                self.summary_process.join()
+        if self.engine is not None:
+            self.engine.close()
+        if self.db is not None:
+            self.db.close()
+        super().closeEvent(event)
+
     def return_to_search(self):
         self.stack.setCurrentWidget(self.search_page)
         self.search_page.setFocus()
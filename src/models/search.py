@@ -24,6 +24,8 @@ class SearchAlgorithm(Enum):
     KMP = "KMP"
     BM = "BM"
     AHO_CORASICK = "Aho-Corasick"
+    BM_GOOD_SUFFIX = "BM-GS"  # Boyer-Moore with both the bad character and good suffix rules
+    HORSPOOL = "Horspool"
 
 @dataclass
 class ApplicantMatchData:
@@ -77,7 +79,7 @@ class CVSummary:
 """CV Extraction data"""
 @dataclass
 class CVSummaryExtraction:
-    # Extracted at runtime
+    # Extracted in the background and stored in the database, or at runtime as a fallback
     description: str
     skills: list[str]
     education: list[EducationEntry]
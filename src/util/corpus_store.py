@@ -0,0 +1,138 @@
+import mmap
+import os
+from array import array
+
+CORPUS_VERSION = 1
+COMPACT_MIN_BYTES = 1 << 20  # Below this much garbage, compaction is not worth a rewrite
+
+class CorpusStore:
+    """
+    The encoded text (see lib.encoding) of every seeded CV in a single file, written at seed
+    time and read through one read-only memory map. An offsets table maps detail_id to the
+    [start, end) range of its text, and get() returns a memoryview slice of the map, so no
+    text is copied into the process. Worker processes map the same file and share its pages
+    in the OS page cache instead of each keeping its own copy of every CV.
+
+    Texts are only ever appended; a replaced or removed CV leaves its old bytes behind until
+    compact() rewrites the file. A rewrite goes to a new generation of the data file, and the
+    offsets table names the generation it belongs to, so readers never pair an offsets table
+    with the wrong file. Readers pick up a new table on refresh().
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.offsets_path = os.path.join(directory, "offsets.bin")
+        self.generation = 0
+        self.offsets: dict[int, tuple[int, int]] = {}  # detail_id -> (start, end)
+        self._version: tuple[int, int, int] | None = None
+        self._view: memoryview | None = None
+        self.refresh()
+
+    def _data_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"corpus.{generation}.bin")
+
+    """ Reading """
+    def refresh(self) -> None:
+        """Reloads the offsets table and remaps the data file if a seeding process wrote a new table."""
+        try:
+            stat = os.stat(self.offsets_path)
+        except OSError:
+            self.generation, self.offsets, self._version, self._view = 0, {}, None, None
+            return
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if version == self._version:
+            return
+
+        table = array('q')
+        try:
+            with open(self.offsets_path, "rb") as f:
+                table.frombytes(f.read())
+        except OSError as e:
+            print(f"Could not load corpus offsets from {self.offsets_path}: {e}")
+            return
+        if len(table) < 2 or table[0] != CORPUS_VERSION:
+            print(f"Ignoring corpus offsets with outdated version {table[0] if table else None}")
+            self.generation, self.offsets, self._version, self._view = 0, {}, version, None
+            return
+
+        self.generation = table[1]
+        self.offsets = {table[i]: (table[i + 1], table[i + 2]) for i in range(2, len(table), 3)}
+        self._version = version
+        # Slices handed out earlier keep the previous map alive until they are released
+        self._view = None
+        try:
+            with open(self._data_path(self.generation), "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    self._view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except OSError as e:
+            if self.offsets:
+                print(f"Could not map corpus file: {e}")
+
+    def get(self, detail_id: int) -> memoryview | None:
+        """The encoded text of a CV without copying it, or None if it is not in the corpus."""
+        span = self.offsets.get(detail_id)
+        if span is None:
+            return None
+        if self._view is None:
+            return memoryview(b"") if span[0] == span[1] else None
+        return self._view[span[0]:span[1]]
+
+    def __contains__(self, detail_id: int) -> bool:
+        return detail_id in self.offsets
+
+    """ Writing, only done by the seeding process """
+    def add(self, documents: dict[int, bytes]) -> None:
+        """Appends the encoded texts (detail_id -> text), replacing earlier texts of the same CVs."""
+        if not documents:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._data_path(self.generation), "ab") as f:
+            start = f.seek(0, os.SEEK_END)
+            for detail_id, text in documents.items():
+                f.write(text)
+                self.offsets[detail_id] = (start, start + len(text))
+                start += len(text)
+        # The data is on disk before the table that points into it
+        self._save_offsets()
+
+    def remove(self, detail_ids: list[int]) -> None:
+        removed = [detail_id for detail_id in detail_ids if self.offsets.pop(detail_id, None) is not None]
+        if removed:
+            self._save_offsets()
+
+    def compact(self) -> None:
+        """Rewrites the live texts into a new data file once replaced and removed texts waste enough space."""
+        data_path = self._data_path(self.generation)
+        try:
+            size = os.path.getsize(data_path)
+        except OSError:
+            return
+        live = sum(end - start for start, end in self.offsets.values())
+        if size - live < max(live, COMPACT_MIN_BYTES):
+            return
+
+        generation = self.generation + 1
+        offsets: dict[int, tuple[int, int]] = {}
+        with open(data_path, "rb") as source, open(self._data_path(generation), "wb") as target:
+            position = 0
+            for detail_id, (start, end) in sorted(self.offsets.items(), key=lambda item: item[1]):
+                source.seek(start)
+                target.write(source.read(end - start))
+                offsets[detail_id] = (position, position + end - start)
+                position += end - start
+        self.generation, self.offsets = generation, offsets
+        self._save_offsets()
+        try:
+            os.remove(data_path)  # Readers that still map it keep their pages until they refresh
+        except OSError:
+            pass
+        print(f"Corpus compacted from {size} to {live} bytes")
+
+    def _save_offsets(self) -> None:
+        table = array('q', [CORPUS_VERSION, self.generation])
+        for detail_id, (start, end) in self.offsets.items():
+            table.extend((detail_id, start, end))
+        tmp_path = f"{self.offsets_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            table.tofile(f)
+        os.replace(tmp_path, self.offsets_path)
@@ -0,0 +1,213 @@
+import os
+import pickle
+import re
+from array import array
+from bisect import bisect_right
+from typing import Callable
+from lib.bk_tree import BKTree
+from lib.levenshtein import max_distance_for_similarity
+
+# Same word definition as the fuzzy search, CV text is already lowercase
+TOKEN_PATTERN = re.compile(r'[a-z]+')
+
+INDEX_VERSION = 1
+
+# (text, patterns) -> {pattern: [start indices]}, e.g. aho_corasick or a wrapped KMP/BM
+MatchFunction = Callable[[str, list[str]], dict[str, list[int]]]
+
+class InvertedIndex:
+    """
+    Inverted index over the words of every CV: term -> {detail_id: positions}.
+
+    Positions are character offsets into the normalized CV text, so they line up with
+    what KMP/BM/Aho-Corasick would report. A keyword made only of letters can never match
+    across a word boundary, so its occurrences are found by running the chosen matcher over
+    the vocabulary (every distinct term once) instead of over every CV.
+    """
+
+    def __init__(self):
+        self.postings: dict[str, dict[int, array]] = {}
+        self.doc_ids: set[int] = set()
+        self._vocabulary: tuple[str, list[int], list[str]] | None = None
+        self._term_tree: BKTree | None = None
+
+    """ Building """
+    @staticmethod
+    def tokenize(text: str) -> dict[str, array]:
+        """term -> positions of one CV, the part of indexing that can run in a worker process"""
+        term_positions: dict[str, array] = {}
+        for match in TOKEN_PATTERN.finditer(text):
+            term = match.group()
+            positions = term_positions.get(term)
+            if positions is None:
+                positions = term_positions[term] = array('I')
+            positions.append(match.start())
+        return term_positions
+
+    def add_postings(self, detail_id: int, term_positions: dict[str, array]) -> None:
+        """Adds a CV that was already tokenized with tokenize()"""
+        if detail_id in self.doc_ids:
+            self.remove_document(detail_id)
+
+        for term, positions in term_positions.items():
+            doc_postings = self.postings.get(term)
+            if doc_postings is None:
+                doc_postings = self.postings[term] = {}
+                if self._term_tree is not None:
+                    self._term_tree.add(term)
+            doc_postings[detail_id] = positions
+        self.doc_ids.add(detail_id)
+        self._vocabulary = None
+
+    def remove_document(self, detail_id: int) -> None:
+        self.remove_documents([detail_id])
+
+    def remove_documents(self, detail_ids: list[int]) -> None:
+        """Removes many CVs in a single pass over the posting lists"""
+        removed = self.doc_ids.intersection(detail_ids)
+        if not removed:
+            return
+        for term in list(self.postings):
+            doc_postings = self.postings[term]
+            for detail_id in removed.intersection(doc_postings):
+                del doc_postings[detail_id]
+            if not doc_postings:
+                del self.postings[term]
+        self.doc_ids -= removed
+        self._vocabulary = None
+
+    """ Persistence """
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": INDEX_VERSION, "postings": self.postings, "doc_ids": self.doc_ids, "term_tree": self._term_tree}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "InvertedIndex":
+        """Loads the index from disk, or returns an empty index if there is none yet."""
+        index = cls()
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            if os.path.exists(path):
+                print(f"Could not load inverted index from {path}: {e}")
+            return index
+
+        if data.get("version") != INDEX_VERSION:
+            print(f"Ignoring inverted index with outdated version {data.get('version')}")
+            return index
+        index.postings = data["postings"]
+        index.doc_ids = data["doc_ids"]
+        index._term_tree = data.get("term_tree")
+        return index
+
+    """ Queries """
+    @staticmethod
+    def is_term_query(keyword: str) -> bool:
+        """True if the keyword can be answered from the posting lists alone."""
+        return TOKEN_PATTERN.fullmatch(keyword) is not None
+
+    def _get_vocabulary(self) -> tuple[str, list[int], list[str]]:
+        # All terms joined by a separator that never appears in a keyword,
+        # plus the start offset of every term to map a match back to its term
+        if self._vocabulary is None:
+            terms = sorted(self.postings)
+            starts = []
+            offset = 0
+            for term in terms:
+                starts.append(offset)
+                offset += len(term) + 1
+            self._vocabulary = ("\n".join(terms), starts, terms)
+        return self._vocabulary
+
+    def terms_containing(self, keywords: list[str], match: MatchFunction) -> dict[str, dict[str, int]]:
+        """
+        Finds every term that contains each keyword.
+        Returns {keyword: {term: occurrences of keyword inside term}}.
+        """
+        result: dict[str, dict[str, int]] = {keyword: {} for keyword in keywords}
+        if not keywords or not self.postings:
+            return result
+
+        text, starts, terms = self._get_vocabulary()
+        for keyword, positions in match(text, keywords).items():
+            term_counts = result[keyword]
+            for position in positions:
+                term = terms[bisect_right(starts, position) - 1]
+                term_counts[term] = term_counts.get(term, 0) + 1
+        return result
+
+    def count_keywords(self, keywords: list[str], match: MatchFunction) -> dict[str, dict[int, int]]:
+        """
+        Counts the occurrences of single-word keywords in every indexed CV.
+        Returns {keyword: {detail_id: occurrences}}, only CVs with at least one match are present.
+        """
+        result: dict[str, dict[int, int]] = {}
+        for keyword, term_counts in self.terms_containing(keywords, match).items():
+            doc_counts: dict[int, int] = {}
+            for term, occurrences_in_term in term_counts.items():
+                for detail_id, positions in self.postings[term].items():
+                    doc_counts[detail_id] = doc_counts.get(detail_id, 0) + occurrences_in_term * len(positions)
+            result[keyword] = doc_counts
+        return result
+
+    def candidates(self, phrase: str, match: MatchFunction) -> set[int] | None:
+        """
+        CVs that may contain a multi-word phrase: every word piece of the phrase must be inside
+        some term of the CV. Returns None when the phrase has no word piece to filter on.
+        """
+        pieces = list(dict.fromkeys(TOKEN_PATTERN.findall(phrase)))
+        if not pieces:
+            return None
+
+        candidate_ids: set[int] | None = None
+        for term_counts in self.terms_containing(pieces, match).values():
+            piece_ids = set()
+            for term in term_counts:
+                piece_ids.update(self.postings[term])
+            candidate_ids = piece_ids if candidate_ids is None else candidate_ids & piece_ids
+            if not candidate_ids:
+                break
+        return candidate_ids
+
+    def term_tree(self) -> BKTree:
+        """
+        BK-tree over every term, built on first use and kept up to date by add_postings.
+        Terms of removed CVs may stay in the tree, they simply have no postings anymore.
+        """
+        if self._term_tree is None:
+            print(f"Building vocabulary BK-tree over {len(self.postings)} terms...")
+            self._term_tree = BKTree(list(self.postings))
+        return self._term_tree
+
+    def similar_terms(self, keyword: str, threshold: float) -> list[str]:
+        """
+        Terms whose similarity to the keyword, 1 - distance / max(len), is at least
+        threshold percent but below 100 (identical terms are exact matches, not fuzzy ones).
+        """
+        max_distance = max_distance_for_similarity(len(keyword), threshold)
+        result = []
+        for term, distance in self.term_tree().search(keyword, max_distance):
+            if term not in self.postings:
+                continue
+            similarity = (1 - (distance / max(len(keyword), len(term)))) * 100
+            if threshold <= similarity < 100:
+                result.append(term)
+        return result
+
+    def fuzzy_counts(self, keywords: list[str], threshold: float) -> dict[str, dict[int, int]]:
+        """
+        For every keyword, counts the distinct similar words in each CV.
+        Returns {keyword: {detail_id: number of similar words}}.
+        """
+        result: dict[str, dict[int, int]] = {}
+        for keyword in keywords:
+            doc_counts: dict[int, int] = {}
+            for term in self.similar_terms(keyword, threshold):
+                for detail_id in self.postings[term]:
+                    doc_counts[detail_id] = doc_counts.get(detail_id, 0) + 1
+            result[keyword] = doc_counts
+        return result
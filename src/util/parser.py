@@ -1,7 +1,7 @@
-import fitz  # PyMuPDF
 import os
 
 def pdf_to_string(pdf_path):
+    import fitz  # PyMuPDF, imported on first use so startup does not pay for it
     doc = fitz.open(pdf_path)
     all_text = []
     for page in doc:
@@ -10,6 +10,7 @@ def pdf_to_string(pdf_path):
     return " ".join(all_text)
 
 def pdf_to_text(pdf_path, txt_output_path):
+    import fitz  # PyMuPDF
     doc = fitz.open(pdf_path)
     all_text = ""
     for page in doc:
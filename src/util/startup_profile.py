@@ -0,0 +1,25 @@
+import time
+
+# Time of the first import of this module, main.py imports it before anything heavy
+_start = time.perf_counter()
+_marks: list[tuple[str, float]] = []
+enabled = False
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+def mark(label: str) -> None:
+    """Records that a startup phase finished, a no-op unless --profile-startup was given"""
+    if enabled:
+        _marks.append((label, time.perf_counter()))
+
+def report() -> None:
+    if not enabled or not _marks:
+        return
+    print("Startup profile:")
+    previous = _start
+    for label, at in _marks:
+        print(f"  {label:<32} +{(at - previous) * 1000:8.1f}ms  (at {(at - _start) * 1000:8.1f}ms)")
+        previous = at
+    _marks.clear()
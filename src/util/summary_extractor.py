@@ -0,0 +1,84 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from lib.regex import extractAll
+from models.search import ApplicationDetail, CVSummaryExtraction
+
+BATCH_SIZE = 64  # Summaries written to the database per query
+
+def extract_one(document: tuple[int, str]) -> tuple[int, CVSummaryExtraction | None]:
+    """Parses one CV, module level so it can be pickled to the process pool"""
+    detail_id, cv_path = document
+    try:
+        return detail_id, extractAll(cv_path)
+    except Exception as e:
+        print(f"Could not extract summary of {cv_path}: {e}")
+        return detail_id, None
+
+def extract_summaries(db, applications: list[ApplicationDetail] | None = None, workers: int | None = None,
+                      is_cancelled: Callable[[], bool] | None = None) -> int:
+    """
+    Extracts the summary sections of every CV that has none stored yet (or of the given
+    applications) and saves them, so opening a summary page is a single lookup.
+    Once is_cancelled() returns True the remaining CVs are skipped, the summaries already
+    extracted are still stored. Returns the number of summaries stored.
+    """
+    if applications is None:
+        applications = db.get_application_details_without_summary()
+    documents = [(app.detail_id, app.cv_path) for app in applications]
+    if not documents:
+        return 0
+
+    print(f"Extracting summaries of {len(documents)} CVs...")
+    start_time = time.time()
+    stored = 0
+    batch: dict[int, CVSummaryExtraction] = {}
+
+    def store(detail_id: int, extraction: CVSummaryExtraction | None) -> None:
+        nonlocal stored, batch
+        if extraction is None:
+            return
+        batch[detail_id] = extraction
+        if len(batch) >= BATCH_SIZE:
+            db.save_summary_extractions(batch)
+            stored += len(batch)
+            batch = {}
+
+    if workers is not None and workers <= 1:
+        for document in documents:
+            if is_cancelled and is_cancelled():
+                break
+            store(*extract_one(document))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # One batch at a time, so a cancellation only waits for the CVs already handed out
+            for i in range(0, len(documents), BATCH_SIZE):
+                if is_cancelled and is_cancelled():
+                    break
+                for detail_id, extraction in pool.map(extract_one, documents[i:i + BATCH_SIZE], chunksize=8):
+                    store(detail_id, extraction)
+
+    if batch:
+        db.save_summary_extractions(batch)
+        stored += len(batch)
+    print(f"Stored {stored} summaries in {time.time() - start_time:.2f}s")
+    return stored
+
+def extract_missing_summaries(backend: str, workers: int | None = None, stop=None) -> None:
+    """
+    Entry point of the process the GUI starts to fill in missing summaries in the background.
+    It opens its own database connection, and parsing the PDFs there never holds the GIL
+    the UI and the search threads need. Setting the stop event ends it after the current CVs.
+    """
+    from database.backends import open_database
+    if hasattr(os, "nice"):
+        os.nice(10)  # Searches and the UI get the cores first
+    db = open_database(backend)
+    try:
+        if db.connection is not None:
+            extract_summaries(db, workers=workers, is_cancelled=stop.is_set if stop else None)
+    except Exception as e:
+        print(f"Background summary extraction failed: {e}")
+    finally:
+        db.close()
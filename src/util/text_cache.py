@@ -0,0 +1,113 @@
+import hashlib
+import os
+import threading
+from lib.encoding import decode_text, encode_text
+from util.parser import pdf_to_string
+
+# Cache lives next to data/, relative to the project root
+DEFAULT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "cache", "text"))
+
+class TextCache:
+    """
+    Content-addressed cache for the normalized (lowercase, single line) text of CV PDFs.
+    Texts are kept in their encoded form (UTF-8 bytes, see lib.encoding): about one byte
+    per character, and the matchers count keywords on it directly.
+
+    Every entry is keyed by a hash of the PDF path, mtime and size. When a PDF changes
+    its key changes too, so the stale entry is simply never read again and the new text
+    is parsed once and stored. Entries are kept on disk (shared between runs and between
+    processes) and in memory (for repeated searches in one session).
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._memory: dict[str, tuple[str, bytes]] = {}  # abspath -> (key, encoded text)
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _key(self, pdf_path: str, mtime_ns: int | None = None, size: int | None = None) -> str | None:
+        # Keyed by the current mtime and size unless those of an earlier version are given
+        if mtime_ns is None or size is None:
+            try:
+                stat = os.stat(pdf_path)
+            except OSError:
+                return None
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        identity = f"{os.path.abspath(pdf_path)}|{mtime_ns}|{size}"
+        return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".txt")
+
+    def get_text(self, pdf_path: str) -> str:
+        """Returns the normalized text of a PDF, parsing it only on a cache miss."""
+        return decode_text(self.get_encoded(pdf_path))
+
+    def get_encoded(self, pdf_path: str, keep: bool = True, stats: dict[str, int] | None = None) -> bytes:
+        """
+        Returns the normalized text of a PDF in its encoded form, without a decoded copy.
+        With keep=False the text is not kept in memory, e.g. when it goes to the corpus store.
+        The lookup is counted in stats["hits"] or stats["misses"] if a stats dict is given.
+        """
+        if not pdf_path:
+            return b""
+
+        key = self._key(pdf_path)
+        if key is None:
+            # Missing file, let the parser report it
+            if stats is not None:
+                stats["misses"] += 1
+            return encode_text(pdf_to_string(pdf_path))
+
+        abs_path = os.path.abspath(pdf_path)
+        with self._lock:
+            cached = self._memory.get(abs_path)
+        if cached and cached[0] == key:
+            if stats is not None:
+                stats["hits"] += 1
+            return cached[1]
+
+        # Entries are UTF-8 text files, so reading them in binary mode already gives the encoded form
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                text = f.read()
+            hit = True
+        except OSError:
+            text = encode_text(pdf_to_string(pdf_path))
+            self._write_entry(entry_path, text)
+            hit = False
+
+        if stats is not None:
+            stats["hits" if hit else "misses"] += 1
+        if keep:
+            with self._lock:
+                self._memory[abs_path] = (key, text)
+        return text
+
+    def _write_entry(self, entry_path: str, text: bytes) -> None:
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(text)
+        os.replace(tmp_path, entry_path)
+
+    def invalidate(self, pdf_path: str, mtime_ns: int | None = None, size: int | None = None) -> None:
+        """
+        Drops the cached text of a PDF, e.g. when it is removed from the database. Pass the
+        mtime and size the text was cached under to drop the entry of a PDF that has since
+        changed or been deleted.
+        """
+        abs_path = os.path.abspath(pdf_path)
+        key = self._key(pdf_path, mtime_ns, size)
+        with self._lock:
+            cached = self._memory.get(abs_path)
+            if cached and (mtime_ns is None or cached[0] == key):
+                del self._memory[abs_path]
+                key = cached[0]
+        if key:
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from lib.bm import BoyerMoore, Horspool, good_suffix_table
+from lib.encoding import encode_text
+
+MATCHERS = [BoyerMoore, Horspool]
+# Periodic texts and patterns over a small alphabet exercise the good suffix shifts
+ALPHABET = "ab •é"
+
+def occurrences(text: str, pattern: str) -> list[int]:
+    """Every start index, overlapping ones included, which str.count would not report"""
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+@pytest.mark.parametrize("matcher_class", MATCHERS)
+def test_search_matches_brute_force(matcher_class):
+    rng = random.Random(20)
+    for _ in range(500):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 200)))
+        pattern = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 6)))
+        expected = occurrences(text, pattern)
+        matcher = matcher_class(pattern)
+        assert matcher.search(text) == expected
+        assert matcher.search(text, limit=2) == expected[:2]
+        assert matcher.count(text) == len(expected)
+        assert matcher.count_encoded(encode_text(text)) == len(expected)
+        assert matcher.count_encoded(memoryview(encode_text(text))) == len(expected)
+
+@pytest.mark.parametrize("matcher_class", MATCHERS)
+def test_count_agrees_with_str_count(matcher_class):
+    # A pattern that cannot overlap itself occurs exactly str.count times
+    rng = random.Random(21)
+    for _ in range(200):
+        text = "".join(rng.choice("abc•") for _ in range(rng.randint(0, 300)))
+        pattern = rng.choice(["ab", "abc", "c•a", "•", "bca", "cab•"])
+        assert matcher_class(pattern).count(text) == text.count(pattern)
+
+@pytest.mark.parametrize("matcher_class", MATCHERS)
+def test_repetitive_text(matcher_class):
+    assert matcher_class("aaa").count("a" * 10) == 8
+    assert matcher_class("aba").search("ababababa") == [0, 2, 4, 6]
+
+def test_good_suffix_shifts_are_safe():
+    # Each shift must be the smallest one that does not skip an occurrence
+    rng = random.Random(22)
+    for _ in range(300):
+        pattern = "".join(rng.choice("ab") for _ in range(rng.randint(1, 8)))
+        m = len(pattern)
+        table = good_suffix_table(pattern)
+        for j in range(m + 1):
+            suffix = pattern[j:]
+            # Smallest shift that realigns the matched suffix and changes the mismatched character
+            expected = next(shift for shift in range(1, m + 1)
+                            if all(k - shift < 0 or pattern[k - shift] == pattern[k] for k in range(j, m))
+                            and (j == 0 or j - 1 - shift < 0 or pattern[j - 1 - shift] != pattern[j - 1]))
+            assert table[j] == expected, (pattern, j, suffix)
@@ -0,0 +1,79 @@
+import random
+from functools import lru_cache
+
+import pytest
+
+import lib.levenshtein as levenshtein
+from lib.levenshtein import (
+    count_similar,
+    levenshtein_distance,
+    levenshtein_within,
+    max_distance_for_similarity,
+    similarity,
+)
+
+ALPHABET = "abcé"
+
+def naive_distance(s1: str, s2: str) -> int:
+    """The recursive definition, memoized so it stays usable for short words"""
+    @lru_cache(maxsize=None)
+    def distance(i: int, j: int) -> int:
+        if i == 0 or j == 0:
+            return i + j
+        return min(distance(i - 1, j) + 1,
+                   distance(i, j - 1) + 1,
+                   distance(i - 1, j - 1) + (s1[i - 1] != s2[j - 1]))
+    return distance(len(s1), len(s2))
+
+def naive_count_similar(keyword: str, words: list[str], threshold: float) -> int:
+    count = 0
+    for word in words:
+        if threshold <= similarity(naive_distance(keyword, word), len(keyword), len(word)) < 100:
+            count += 1
+    return count
+
+def random_word(rng: random.Random, max_length: int = 8) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+def test_distance_matches_naive():
+    rng = random.Random(24)
+    for _ in range(500):
+        s1, s2 = random_word(rng), random_word(rng)
+        assert levenshtein_distance(s1, s2) == naive_distance(s1, s2)
+
+def test_within_matches_naive():
+    rng = random.Random(25)
+    for _ in range(1000):
+        s1, s2 = random_word(rng), random_word(rng)
+        max_dist = rng.randint(0, 5)
+        distance = naive_distance(s1, s2)
+        assert levenshtein_within(s1, s2, max_dist) == (distance if distance <= max_dist else None)
+
+def test_max_distance_for_similarity_is_tight():
+    # The bound admits every word that reaches the threshold and nothing further away
+    for length in range(1, 30):
+        for threshold in (50.0, 75.0, 80.0, 90.0):
+            bound = max_distance_for_similarity(length, threshold)
+            assert similarity(bound, length, length + bound) >= threshold
+            assert similarity(bound + 1, length, length + bound + 1) < threshold
+
+def test_batch_matches_naive():
+    pytest.importorskip("numpy")
+    rng = random.Random(26)
+    for _ in range(100):
+        keyword = random_word(rng)
+        words = [random_word(rng) for _ in range(rng.randint(0, 40))]
+        assert list(levenshtein.levenshtein_batch(keyword, words)) == [naive_distance(keyword, word) for word in words]
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_count_similar_matches_naive(use_numpy, monkeypatch):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(levenshtein, "NUMPY_AVAILABLE", use_numpy)
+    rng = random.Random(27)
+    for _ in range(200):
+        keyword = random_word(rng, 10) or "a"
+        # Enough words to take the batch path when numpy is used
+        words = [random_word(rng, 12) for _ in range(rng.randint(0, 3 * levenshtein.BATCH_MIN_WORDS))]
+        threshold = rng.choice([50.0, 70.0, 80.0])
+        assert count_similar(keyword, words, threshold) == naive_count_similar(keyword, words, threshold)
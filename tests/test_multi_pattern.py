@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from lib.aho_corasick import AhoCorasick
+from lib.bm import CommentzWalter
+from lib.encoding import encode_text
+from lib.kmp import MultiKMP
+
+SCANNERS = [MultiKMP, CommentzWalter, AhoCorasick]
+# A small alphabet makes overlapping and nested keywords common; '•' and 'é' are multi-byte in UTF-8
+ALPHABET = "ab •é"
+
+def occurrences(text: str, pattern: str) -> list[int]:
+    """Every start index, overlapping ones included, which str.count would not report"""
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+def random_case(rng: random.Random) -> tuple[str, list[str]]:
+    text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 200)))
+    patterns = list({"".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 5))})
+    return text, patterns
+
+@pytest.mark.parametrize("scanner_class", SCANNERS)
+def test_scan_matches_brute_force(scanner_class):
+    rng = random.Random(21)
+    for _ in range(300):
+        text, patterns = random_case(rng)
+        assert scanner_class(patterns).scan(text) == {pattern: occurrences(text, pattern) for pattern in patterns}
+
+@pytest.mark.parametrize("scanner_class", SCANNERS)
+def test_count_matches_brute_force(scanner_class):
+    rng = random.Random(22)
+    for _ in range(300):
+        text, patterns = random_case(rng)
+        expected = {pattern: len(occurrences(text, pattern)) for pattern in patterns}
+        scanner = scanner_class(patterns)
+        assert scanner.count(text) == expected
+        # The encoded text is scanned both as bytes (text cache) and as a memoryview (corpus store)
+        assert scanner.count_encoded(encode_text(text)) == expected
+        assert scanner.count_encoded(memoryview(encode_text(text))) == expected
+
+@pytest.mark.parametrize("scanner_class", SCANNERS)
+def test_count_agrees_with_str_count(scanner_class):
+    # Words separated by spaces cannot overlap, so here str.count is the reference
+    rng = random.Random(23)
+    words = ["python", "java", "sql", "data", "developer", "devops", "é", "•"]
+    for _ in range(100):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 50)))
+        patterns = rng.sample(words, rng.randint(1, 4))
+        expected = {pattern: text.count(pattern) for pattern in patterns}
+        assert scanner_class(patterns).count_encoded(memoryview(encode_text(text))) == expected
+
+@pytest.mark.parametrize("scanner_class", SCANNERS)
+def test_count_encoded_across_translate_chunks(scanner_class, monkeypatch):
+    # Matches that straddle two chunks of a translated memoryview must still be found
+    monkeypatch.setattr("lib.encoding.TRANSLATE_CHUNK_SIZE", 7)
+    rng = random.Random(24)
+    for _ in range(100):
+        text, patterns = random_case(rng)
+        expected = {pattern: len(occurrences(text, pattern)) for pattern in patterns}
+        assert scanner_class(patterns).count_encoded(memoryview(encode_text(text))) == expected
+
+@pytest.mark.parametrize("scanner_class", SCANNERS)
+def test_scan_limit(scanner_class):
+    text = "abababab"
+    assert scanner_class(["ab", "ba"]).scan(text, limit=2) == {"ab": [0, 2], "ba": [1, 3]}
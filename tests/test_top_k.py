@@ -0,0 +1,29 @@
+import random
+
+from engine.top_k import TopK
+
+def test_matches_stable_sort():
+    # Few distinct scores, so ties are common and must go to the item pushed first
+    rng = random.Random(19)
+    for _ in range(500):
+        scores = [rng.randint(0, 5) for _ in range(rng.randint(0, 40))]
+        k = rng.randint(-1, 45)
+        top = TopK(k)
+        for item, score in enumerate(scores):
+            top.push(score, item)
+        expected = sorted(range(len(scores)), key=lambda item: scores[item], reverse=True)
+        assert top.items() == (expected if k <= 0 else expected[:k])
+
+def test_accepts_only_scores_that_would_be_kept():
+    rng = random.Random(20)
+    for _ in range(200):
+        k = rng.randint(1, 10)
+        top = TopK(k)
+        for item in range(rng.randint(0, 30)):
+            score = rng.randint(0, 5)
+            before = top.items()
+            accepted = top.accepts(score)
+            top.push(score, item)
+            assert accepted == (item in top.items())
+            if not accepted:
+                assert top.items() == before